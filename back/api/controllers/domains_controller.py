@@ -47,7 +47,7 @@ async def create_domain(
     logger.info(f"Generating DKIM keys for domain: {domain_data.name}")
     try:
         dkim_service = DKIMService()
-        private_key_pem, public_key_base64 = dkim_service.generate_dkim_keypair(key_size=2048)
+        private_key_pem, public_key_base64 = await dkim_service.agenerate_dkim_keypair(key_size=2048)
         dkim_selector = dkim_service.get_dkim_selector()
 
         logger.info(f"DKIM keys generated successfully for {domain_data.name}")
@@ -168,7 +168,7 @@ async def verify_domain(
     logger.info(f"Starting DNS verification for domain: {domain.name}")
 
     # Perform real DNS verification with expected DKIM public key
-    verification_results = dns_service.verify_all(
+    verification_results = await dns_service.verify_all(
         domain=domain.name,
         expected_mx="mail.smtpy.fr",
         expected_spf_include="smtpy.fr",
@@ -377,7 +377,7 @@ async def regenerate_dkim_keys(
     try:
         # Generate new DKIM keypair
         dkim_service = DKIMService()
-        private_key_pem, public_key_base64 = dkim_service.generate_dkim_keypair(key_size=key_size)
+        private_key_pem, public_key_base64 = await dkim_service.agenerate_dkim_keypair(key_size=key_size)
         dkim_selector = dkim_service.get_dkim_selector()
 
         # Format DNS information
@@ -2,10 +2,37 @@
 
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, delete, insert
 from sqlalchemy.orm import selectinload
 
 from shared.models.alias import Alias
+from shared.models.alias_target import AliasTarget
+
+
+async def _sync_alias_targets(db: AsyncSession, alias_id: int, targets: str) -> None:
+    """Match the alias_targets rows of an alias to its comma-separated targets.
+
+    Only added and removed addresses are written, so targets that stay keep
+    their delivery state (is_active, bounce_count).
+    """
+    emails = dict.fromkeys(t.strip() for t in targets.split(',') if t.strip())
+
+    result = await db.execute(select(AliasTarget.email).where(AliasTarget.alias_id == alias_id))
+    existing = set(result.scalars())
+
+    removed = existing.difference(emails)
+    if removed:
+        await db.execute(
+            delete(AliasTarget).where(
+                AliasTarget.alias_id == alias_id, AliasTarget.email.in_(removed)
+            )
+        )
+    added = [email for email in emails if email not in existing]
+    if added:
+        await db.execute(
+            insert(AliasTarget),
+            [{"alias_id": alias_id, "email": email} for email in added]
+        )
 
 
 async def create_alias(
@@ -25,6 +52,8 @@ async def create_alias(
     )
 
     db.add(alias)
+    await db.flush()
+    await _sync_alias_targets(db, alias.id, targets)
     await db.commit()
     await db.refresh(alias)
     return alias
@@ -139,6 +168,9 @@ async def update_alias(
         if hasattr(alias, key):
             setattr(alias, key, value)
 
+    if updates.get("targets") is not None:
+        await _sync_alias_targets(db, alias.id, alias.targets)
+
     await db.commit()
     await db.refresh(alias)
     return alias
@@ -5,7 +5,7 @@ from typing import Optional
 
 from sqlalchemy import select, update, delete, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, joinedload
 
 from shared.models.message import Message, MessageStatus
 from shared.models.domain import Domain
@@ -46,7 +46,7 @@ async def get_message_by_id(db: AsyncSession, message_id: int) -> Optional[Messa
     """Get message by ID."""
     stmt = (
         select(Message)
-        .options(selectinload(Message.domain))
+        .options(joinedload(Message.domain, innerjoin=True))
         .where(Message.id == message_id)
     )
     result = await db.execute(stmt)
@@ -57,7 +57,7 @@ async def get_message_by_message_id(db: AsyncSession, message_id: str) -> Option
     """Get message by unique message ID."""
     stmt = (
         select(Message)
-        .options(selectinload(Message.domain))
+        .options(joinedload(Message.domain, innerjoin=True))
         .where(Message.message_id == message_id)
     )
     result = await db.execute(stmt)
@@ -81,7 +81,7 @@ async def get_messages_by_organization(
     stmt = (
         select(Message)
         .join(Domain, Message.domain_id == Domain.id)
-        .options(selectinload(Message.domain))
+        .options(contains_eager(Message.domain))
         .where(Domain.organization_id == organization_id)
     )
     
@@ -154,7 +154,7 @@ async def get_messages_by_domain(
     """Get messages for a specific domain."""
     stmt = (
         select(Message)
-        .options(selectinload(Message.domain))
+        .options(joinedload(Message.domain, innerjoin=True))
         .where(Message.domain_id == domain_id)
         .order_by(Message.created_at.desc())
         .offset(skip)
@@ -203,50 +203,26 @@ async def get_message_stats_by_organization(
     since_date: Optional[datetime] = None
 ) -> dict:
     """Get message statistics for an organization."""
-    # Base query joining with domains
-    base_stmt = (
-        select(Message)
-        .join(Domain, Message.domain_id == Domain.id)
-        .where(Domain.organization_id == organization_id)
-    )
-    
-    if since_date:
-        base_stmt = base_stmt.where(Message.created_at >= since_date)
-    
-    # Total messages
-    total_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total_result = await db.execute(total_stmt)
-    total_messages = total_result.scalar() or 0
-    
-    # Messages by status
-    status_stats = {}
-    for status in MessageStatus:
-        status_stmt = (
-            select(func.count(Message.id))
-            .join(Domain, Message.domain_id == Domain.id)
-            .where(
-                Domain.organization_id == organization_id,
-                Message.status == status
-            )
-        )
-        if since_date:
-            status_stmt = status_stmt.where(Message.created_at >= since_date)
-        
-        status_result = await db.execute(status_stmt)
-        status_stats[status.value] = status_result.scalar() or 0
-    
-    # Total size
-    size_stmt = (
-        select(func.sum(Message.size_bytes))
+    # One grouped pass yields the per-status counts, the total and the size
+    stmt = (
+        select(Message.status, func.count(Message.id), func.sum(Message.size_bytes))
         .join(Domain, Message.domain_id == Domain.id)
         .where(Domain.organization_id == organization_id)
+        .group_by(Message.status)
     )
     if since_date:
-        size_stmt = size_stmt.where(Message.created_at >= since_date)
-    
-    size_result = await db.execute(size_stmt)
-    total_size_bytes = size_result.scalar() or 0
-    
+        stmt = stmt.where(Message.created_at >= since_date)
+
+    result = await db.execute(stmt)
+
+    status_stats = {status.value: 0 for status in MessageStatus}
+    total_messages = 0
+    total_size_bytes = 0
+    for status, count, size in result:
+        status_stats[status.value] = count
+        total_messages += count
+        total_size_bytes += size or 0
+
     return {
         "total_messages": total_messages,
         "delivered_messages": status_stats.get("delivered", 0),
@@ -265,7 +241,7 @@ async def get_messages_by_thread(
     """Get messages in a thread."""
     stmt = (
         select(Message)
-        .options(selectinload(Message.domain))
+        .options(joinedload(Message.domain, innerjoin=True))
         .where(Message.thread_id == thread_id)
     )
     
@@ -293,7 +269,7 @@ async def search_messages(
     stmt = (
         select(Message)
         .join(Domain, Message.domain_id == Domain.id)
-        .options(selectinload(Message.domain))
+        .options(contains_eager(Message.domain))
         .where(
             Domain.organization_id == organization_id,
             or_(
@@ -320,7 +296,7 @@ async def get_recent_messages_by_organization(
     stmt = (
         select(Message)
         .join(Domain, Message.domain_id == Domain.id)
-        .options(selectinload(Message.domain))
+        .options(contains_eager(Message.domain))
         .where(Domain.organization_id == organization_id)
         .order_by(Message.created_at.desc())
         .limit(limit)
@@ -345,7 +321,7 @@ async def get_messages_by_email(
     stmt = (
         select(Message)
         .join(Domain, Message.domain_id == Domain.id)
-        .options(selectinload(Message.domain))
+        .options(contains_eager(Message.domain))
         .where(
             Domain.organization_id == organization_id,
             or_(
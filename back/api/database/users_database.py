@@ -1,12 +1,12 @@
 """User database operations for SMTPy v2."""
 
-import bcrypt
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from shared.models import (
     User, PasswordResetToken, EmailVerificationToken, UserRole,
@@ -35,7 +35,7 @@ class UsersDatabase:
             role=role,
             is_verified=is_verified,
         )
-        user.set_password(password)
+        await user.aset_password(password)
 
         session.add(user)
         await session.flush()
@@ -83,8 +83,6 @@ class UsersDatabase:
         session: AsyncSession, username_or_email: str, password: str
     ) -> Optional[User]:
         """Verify user credentials and return user if valid."""
-        from sqlalchemy.orm import selectinload
-
         # Eagerly load organization to avoid lazy loading issues
         result = await session.execute(
             select(User)
@@ -101,11 +99,8 @@ class UsersDatabase:
         if not user.is_active:
             return None
 
-        # Access password_hash directly to avoid any lazy loading issues
-        password_matches = bcrypt.checkpw(
-            password.encode('utf-8'),
-            user.password_hash.encode('utf-8')
-        )
+        # bcrypt is CPU-bound and releases the GIL, so run it off the event loop
+        password_matches = await user.averify_password(password)
 
         if not password_matches:
             return None
@@ -120,7 +115,7 @@ class UsersDatabase:
     @staticmethod
     async def update_password(session: AsyncSession, user: User, new_password: str) -> User:
         """Update user's password."""
-        user.set_password(new_password)
+        await user.aset_password(new_password)
         await session.flush()
         await session.refresh(user)
         return user
@@ -376,7 +371,9 @@ class UsersDatabase:
     ) -> list[APIKey]:
         """Get API keys by prefix (there might be multiple with same prefix)."""
         result = await session.execute(
-            select(APIKey).where(APIKey.prefix == prefix, APIKey.is_active == True)
+            select(APIKey)
+            .where(APIKey.prefix == prefix, APIKey.is_active.is_(True))
+            .options(selectinload(APIKey.user))
         )
         return list(result.scalars().all())
 
@@ -394,20 +391,29 @@ class UsersDatabase:
             User object if key is valid, None otherwise
         """
         # Extract prefix from key
-        if not key.startswith("smtpy_sk_"):
+        if not key.startswith("smtpy_sk_") or len(key) <= 16:
             return None
 
         prefix = key[:16]
 
-        # Get all active keys with this prefix
+        # Single indexed lookup on active keys with this prefix
         api_keys = await UsersDatabase.get_api_key_by_prefix(session, prefix)
 
-        # Try to verify against each key (should typically be only one)
+        # Try to verify against each key (should typically be only one).
+        # Check expiry first so expired keys never cost a hash comparison.
+        now = datetime.now(timezone.utc)
+        presented_hash = APIKey.hash_key(key)
         for api_key in api_keys:
-            if api_key.verify_key(key) and api_key.is_valid():
+            stored_hash = api_key.key_hash
+            if api_key.is_valid(now) and await api_key.averify_key(key, presented_hash):
                 # Update last used timestamp
-                api_key.last_used_at = datetime.now(timezone.utc)
-                await session.flush()
+                api_key.last_used_at = now
+                if api_key.key_hash != stored_hash:
+                    # Legacy bcrypt hash upgraded: commit it now, since read-only
+                    # requests never commit and the upgrade would be rolled back
+                    await session.commit()
+                else:
+                    await session.flush()
 
                 # Return the user
                 return api_key.user
@@ -420,6 +426,7 @@ class UsersDatabase:
     ) -> APIKey:
         """Revoke (deactivate) an API key."""
         api_key.is_active = False
+        APIKey.invalidate(api_key.id)
         await session.flush()
         await session.refresh(api_key)
         return api_key
@@ -429,6 +436,7 @@ class UsersDatabase:
         session: AsyncSession, api_key: APIKey
     ) -> None:
         """Permanently delete an API key."""
+        APIKey.invalidate(api_key.id)
         await session.delete(api_key)
         await session.flush()
 
@@ -537,16 +545,13 @@ class UsersDatabase:
         """
         now = datetime.now(timezone.utc)
 
+        # Single UPDATE served by the partial index on live sessions' expires_at
         result = await session.execute(
-            select(Session).where(
-                Session.is_active == True,
-                Session.expires_at < now
-            )
+            update(Session)
+            .where(Session.is_active.is_(True), Session.expires_at < now)
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
         )
-        expired_sessions = list(result.scalars().all())
-
-        for user_session in expired_sessions:
-            user_session.is_active = False
 
         await session.flush()
-        return len(expired_sessions)
+        return result.rowcount or 0
@@ -1,13 +1,17 @@
+import asyncio
 import os
-from contextlib import asynccontextmanager
+import random
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.views import auth_view, billing_view, domains_view, messages_view, subscriptions_view, webhooks_view, statistics_view, aliases_view, admin_view, users_view, rules_view
 from api.views import utils_view
+from api.database.users_database import UsersDatabase
 from shared.core.config import SETTINGS
-from shared.core.db import create_tables
+from shared.core.db import create_tables, async_sessionmaker_factory
 from shared.core.logging_config import setup_logging, get_logger
 from shared.core.middlewares import SecurityHeadersMiddleware, SimpleRateLimiter
 
@@ -16,17 +20,43 @@ setup_logging()
 logger = get_logger(__name__)
 
 
+async def cleanup_expired_sessions_periodically(interval_seconds: int) -> None:
+    """Mark expired sessions inactive in the background at a fixed interval."""
+    # Random phase so workers started together don't all run the UPDATE at once
+    await asyncio.sleep(random.uniform(0, interval_seconds))
+    while True:
+        try:
+            async with async_sessionmaker_factory() as session:
+                count = await UsersDatabase.cleanup_expired_sessions(session)
+                await session.commit()
+            if count:
+                logger.info(f"Marked {count} expired session(s) inactive")
+        except Exception as e:
+            logger.error(f"Expired session cleanup failed: {str(e)}")
+        await asyncio.sleep(interval_seconds)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     logger.info("Application startup - creating database tables")
     await create_tables()
+
+    cleanup_task = None
+    if SETTINGS.SESSION_CLEANUP_INTERVAL_SECONDS > 0:
+        cleanup_task = asyncio.create_task(
+            cleanup_expired_sessions_periodically(SETTINGS.SESSION_CLEANUP_INTERVAL_SECONDS)
+        )
+
     logger.info("Application startup complete")
     yield
     # Shutdown
     logger.info("Application shutdown")
-    pass
+    if cleanup_task:
+        cleanup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await cleanup_task
 
 
 def create_app() -> FastAPI:
@@ -95,6 +125,7 @@ Success responses follow this structure:
 ```
         """,
         version="2.0.0",
+        default_response_class=ORJSONResponse,
         docs_url='/docs',
         redoc_url='/redoc',
         openapi_tags=[
@@ -1,5 +1,6 @@
 """DKIM key generation and management service."""
 
+import asyncio
 import base64
 import logging
 from typing import Tuple
@@ -60,6 +61,15 @@ class DKIMService:
 
         return private_pem, public_base64
 
+    @staticmethod
+    async def agenerate_dkim_keypair(key_size: int = 2048) -> Tuple[str, str]:
+        """Generate a DKIM RSA keypair in a worker thread.
+
+        RSA key generation takes tens to hundreds of milliseconds of CPU, so it
+        is kept off the event loop. See generate_dkim_keypair for details.
+        """
+        return await asyncio.to_thread(DKIMService.generate_dkim_keypair, key_size)
+
     @staticmethod
     def format_dkim_public_key_for_dns(public_key_base64: str) -> str:
         """Format a public key for DNS TXT record.
@@ -1,12 +1,31 @@
 """DNS verification service for domain validation."""
 
+import asyncio
 import logging
+import time
 from typing import Optional
+import dns.asyncresolver
 import dns.resolver
 import dns.exception
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long a cached answer is reused, even when the record TTL
+# is longer, so re-verifying after fixing a record does not wait out the TTL
+DNS_CACHE_MAX_TTL = 300.0
+
+
+class _CappedTTLCache(dns.resolver.LRUCache):
+    """Resolver answer cache that honors record TTLs, capped at DNS_CACHE_MAX_TTL."""
+
+    def put(self, key, value):
+        value.expiration = min(value.expiration, time.time() + DNS_CACHE_MAX_TTL)
+        super().put(key, value)
+
+
+# Shared by every DNSService instance; a new service is built per request
+_RESOLVER_CACHE = _CappedTTLCache(max_size=2048)
+
 
 class DNSService:
     """Service for verifying DNS records."""
@@ -18,11 +37,13 @@ class DNSService:
             timeout: DNS query timeout in seconds
         """
         self.timeout = timeout
-        self.resolver = dns.resolver.Resolver()
+        # Non-blocking resolver: queries run on the event loop, not in a thread
+        self.resolver = dns.asyncresolver.Resolver()
         self.resolver.timeout = timeout
         self.resolver.lifetime = timeout
+        self.resolver.cache = _RESOLVER_CACHE
 
-    def verify_mx_record(self, domain: str, expected_mx: str) -> bool:
+    async def verify_mx_record(self, domain: str, expected_mx: str) -> bool:
         """Verify MX record points to expected mail server.
 
         Args:
@@ -37,7 +58,7 @@ class DNSService:
             expected_mx_normalized = expected_mx.rstrip('.')
 
             # Query MX records
-            mx_records = self.resolver.resolve(domain, 'MX')
+            mx_records = await self.resolver.resolve(domain, 'MX')
 
             # Check if any MX record matches expected value
             for mx in mx_records:
@@ -64,7 +85,7 @@ class DNSService:
             logger.error(f"Error verifying MX record for {domain}: {e}")
             return False
 
-    def verify_spf_record(self, domain: str, expected_include: str) -> bool:
+    async def verify_spf_record(self, domain: str, expected_include: str) -> bool:
         """Verify SPF record includes expected domain.
 
         Args:
@@ -76,7 +97,7 @@ class DNSService:
         """
         try:
             # Query TXT records
-            txt_records = self.resolver.resolve(domain, 'TXT')
+            txt_records = await self.resolver.resolve(domain, 'TXT')
 
             # Find SPF record
             for record in txt_records:
@@ -109,7 +130,7 @@ class DNSService:
             logger.error(f"Error verifying SPF record for {domain}: {e}")
             return False
 
-    def verify_dkim_record(
+    async def verify_dkim_record(
         self,
         domain: str,
         selector: str = "default",
@@ -130,7 +151,7 @@ class DNSService:
             dkim_domain = f"{selector}._domainkey.{domain}"
 
             # Query TXT records
-            txt_records = self.resolver.resolve(dkim_domain, 'TXT')
+            txt_records = await self.resolver.resolve(dkim_domain, 'TXT')
 
             # Find DKIM record
             for record in txt_records:
@@ -207,7 +228,7 @@ class DNSService:
             logger.error(f"Error extracting public key from DKIM record: {e}")
             return None
 
-    def verify_dmarc_record(self, domain: str) -> bool:
+    async def verify_dmarc_record(self, domain: str) -> bool:
         """Verify DMARC record exists.
 
         Args:
@@ -221,7 +242,7 @@ class DNSService:
             dmarc_domain = f"_dmarc.{domain}"
 
             # Query TXT records
-            txt_records = self.resolver.resolve(dmarc_domain, 'TXT')
+            txt_records = await self.resolver.resolve(dmarc_domain, 'TXT')
 
             # Find DMARC record
             for record in txt_records:
@@ -247,7 +268,7 @@ class DNSService:
             logger.error(f"Error verifying DMARC record for {domain}: {e}")
             return False
 
-    def verify_all(
+    async def verify_all(
         self,
         domain: str,
         expected_mx: str = "mail.smtpy.fr",
@@ -267,9 +288,16 @@ class DNSService:
         Returns:
             Dictionary with verification results for each record type
         """
+        # The four lookups are independent, so resolve them concurrently
+        mx_verified, spf_verified, dkim_verified, dmarc_verified = await asyncio.gather(
+            self.verify_mx_record(domain, expected_mx),
+            self.verify_spf_record(domain, expected_spf_include),
+            self.verify_dkim_record(domain, dkim_selector, expected_dkim_public_key),
+            self.verify_dmarc_record(domain),
+        )
         return {
-            "mx_verified": self.verify_mx_record(domain, expected_mx),
-            "spf_verified": self.verify_spf_record(domain, expected_spf_include),
-            "dkim_verified": self.verify_dkim_record(domain, dkim_selector, expected_dkim_public_key),
-            "dmarc_verified": self.verify_dmarc_record(domain),
+            "mx_verified": mx_verified,
+            "spf_verified": spf_verified,
+            "dkim_verified": dkim_verified,
+            "dmarc_verified": dmarc_verified,
         }
@@ -4,9 +4,9 @@ import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
-import aiosmtplib
 
 from shared.core.config import SETTINGS
+from .smtp_pool import get_relay_pool
 
 logger = logging.getLogger(__name__)
 
@@ -61,16 +61,13 @@ class EmailService:
             part2 = MIMEText(html_content, "html", "utf-8")
             message.attach(part2)
 
-            # Send via Docker mailserver
-            await aiosmtplib.send(
-                message,
-                hostname=SETTINGS.MAILSERVER_HOST,
-                port=SETTINGS.MAILSERVER_PORT,
-                username=SETTINGS.MAILSERVER_USER if SETTINGS.MAILSERVER_USER else None,
-                password=SETTINGS.MAILSERVER_PASSWORD if SETTINGS.MAILSERVER_PASSWORD else None,
-                use_tls=SETTINGS.MAILSERVER_USE_TLS,
-                start_tls=SETTINGS.MAILSERVER_USE_TLS,
-            )
+            # Serialize before borrowing a connection so the pool slot is only
+            # held for the SMTP exchange itself
+            raw_message = message.as_bytes()
+
+            # Send via Docker mailserver over a pooled connection
+            async with get_relay_pool().acquire() as smtp:
+                await smtp.sendmail(from_email, [to], raw_message)
 
             logger.info(f"Email sent successfully to {to}: {subject}")
             return True
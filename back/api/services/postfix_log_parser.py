@@ -69,6 +69,17 @@ class PostfixLogParser:
     DNSBL_PATTERN = re.compile(
         r'blocked using (.+); (.+) from \[([^\]]+)\]'
     )
+    ISO_TIMESTAMP_PATTERN = re.compile(
+        r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+[+-]\d{2}:\d{2})'
+    )
+    SYSLOG_TIMESTAMP_PATTERN = re.compile(
+        r'^(\w{3})\s+(\d{1,2})\s+(\d{2}):(\d{2}):(\d{2})'
+    )
+    SYSLOG_MONTHS = {
+        name: number for number, name in enumerate(
+            ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+        )
+    }
 
     def __init__(self, log_path: Optional[str] = None):
         """Initialize the parser.
@@ -77,6 +88,8 @@ class PostfixLogParser:
             log_path: Path to Postfix log file. If None, uses default Docker Mailserver location.
         """
         self.log_path = log_path or "/var/log/mail/mail.log"
+        # Syslog lines carry no year; read the clock once, not once per line
+        self._current_year = datetime.now().year
 
     def parse_timestamp(self, log_line: str) -> Optional[datetime]:
         """Extract timestamp from log line.
@@ -89,19 +102,24 @@ class PostfixLogParser:
         """
         try:
             # Docker Mailserver format: "2025-12-13T09:48:20.816552-05:00"
-            timestamp_match = re.match(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+[+-]\d{2}:\d{2})', log_line)
+            timestamp_match = self.ISO_TIMESTAMP_PATTERN.match(log_line)
             if timestamp_match:
                 timestamp_str = timestamp_match.group(1)
                 # Parse ISO format with timezone
                 return datetime.fromisoformat(timestamp_str)
 
             # Alternative format: "Dec 13 09:48:20"
-            timestamp_match = re.match(r'^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})', log_line)
+            timestamp_match = self.SYSLOG_TIMESTAMP_PATTERN.match(log_line)
             if timestamp_match:
-                timestamp_str = timestamp_match.group(1)
-                # Parse with current year (syslog format doesn't include year)
-                current_year = datetime.now().year
-                return datetime.strptime(f"{current_year} {timestamp_str}", "%Y %b %d %H:%M:%S")
+                month_name, day, hour, minute, second = timestamp_match.groups()
+                month = self.SYSLOG_MONTHS.get(month_name)
+                if month is None:
+                    return None
+                # Parse with current year (syslog format doesn't include year);
+                # building the datetime directly avoids strptime's per-call cost
+                return datetime(
+                    self._current_year, month, int(day), int(hour), int(minute), int(second)
+                )
         except Exception as e:
             logger.debug(f"Failed to parse timestamp from line: {log_line[:50]}... Error: {e}")
 
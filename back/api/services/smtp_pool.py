@@ -0,0 +1,205 @@
+"""Pool of persistent, authenticated SMTP connections to the relay mailserver."""
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional
+
+import aiosmtplib
+
+from shared.core.config import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+class _CountingSMTP(aiosmtplib.SMTP):
+    """SMTP client that counts the mail transactions sent over it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.messages_sent = 0
+
+    async def sendmail(self, *args, **kwargs):
+        # send_message goes through sendmail too
+        self.messages_sent += 1
+        return await super().sendmail(*args, **kwargs)
+
+
+@dataclass(slots=True)
+class _PooledConnection:
+    """An open SMTP client plus the bookkeeping needed to recycle it."""
+
+    client: _CountingSMTP
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SMTPConnectionPool:
+    """
+    Keep a bounded set of warm SMTP connections to a single relay.
+
+    Connection setup (TCP handshake, EHLO, STARTTLS, AUTH) costs several round
+    trips, so forwarded messages reuse idle connections instead of dialing the
+    relay for every delivery. Connections are retired once ``max_messages``
+    messages have been sent over them, however many borrows that took, and
+    idle ones are probed with NOOP before reuse.
+
+    ``connect_timeout`` bounds dialing (TCP, TLS handshake and greeting) and
+    the NOOP probe, so an unreachable relay fails fast; ``timeout`` applies
+    to every other command, where a large DATA transfer may legitimately
+    take a while.
+
+    After ``failure_threshold`` consecutive failed dials the pool stops dialing
+    for ``reset_seconds`` and fails immediately instead; the next dial after
+    that window is a probe that either closes the circuit or reopens it.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: bool = False,
+        max_size: int = 5,
+        max_messages: int = 100,
+        idle_check_seconds: float = 30.0,
+        timeout: float = 60.0,
+        connect_timeout: float = 10.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username or None
+        self.password = password or None
+        self.start_tls = start_tls
+        self.max_messages = max_messages
+        self.idle_check_seconds = idle_check_seconds
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._open_until = 0.0
+        # EHLO name, resolved by the first connection and reused after that
+        self._local_hostname: Optional[str] = None
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: List[_PooledConnection] = []
+
+    async def _connect(self) -> _PooledConnection:
+        """Open, upgrade and authenticate a new relay connection."""
+        if self._failures >= self.failure_threshold and time.monotonic() < self._open_until:
+            raise aiosmtplib.SMTPConnectError(
+                f"Relay {self.hostname}:{self.port} unavailable, not retrying until circuit resets"
+            )
+
+        client = _CountingSMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+            local_hostname=self._local_hostname,
+        )
+        try:
+            await client.connect(timeout=self.connect_timeout)
+        except Exception:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._open_until = time.monotonic() + self.reset_seconds
+                logger.warning(
+                    f"SMTP relay {self.hostname}:{self.port} failed {self._failures} dials in a row, "
+                    f"pausing for {self.reset_seconds:.0f}s"
+                )
+            raise
+        self._failures = 0
+        # aiosmtplib otherwise runs socket.getfqdn() in a thread on every dial
+        self._local_hostname = client.local_hostname
+        logger.debug(f"Opened SMTP connection to {self.hostname}:{self.port}")
+        return _PooledConnection(client=client)
+
+    async def _is_alive(self, conn: _PooledConnection) -> bool:
+        """Check that an idle connection can still be used."""
+        if not conn.client.is_connected:
+            return False
+        if time.monotonic() - conn.last_used < self.idle_check_seconds:
+            return True
+        try:
+            code, _ = await conn.client.noop(timeout=self.connect_timeout)
+        except aiosmtplib.SMTPException:
+            return False
+        return code == 250
+
+    async def _discard(self, conn: _PooledConnection) -> None:
+        """Close a connection, politely if the server is still there."""
+        try:
+            if conn.client.is_connected:
+                await conn.client.quit()
+        except Exception:
+            conn.client.close()
+
+    async def _checkout(self) -> _PooledConnection:
+        while self._idle:
+            conn = self._idle.pop()
+            if await self._is_alive(conn):
+                return conn
+            await self._discard(conn)
+        return await self._connect()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        Borrow a connected client for one or more sends.
+
+        The connection is returned to the pool on success and closed if the
+        body raises, since the SMTP conversation may be left mid-transaction.
+        """
+        async with self._slots:
+            conn = await self._checkout()
+            try:
+                yield conn.client
+            except BaseException:
+                await self._discard(conn)
+                raise
+            conn.last_used = time.monotonic()
+            if conn.client.messages_sent < self.max_messages:
+                self._idle.append(conn)
+                return
+        # Retire outside the slot so the QUIT round trip doesn't delay the next borrower
+        await self._discard(conn)
+
+    async def close(self) -> None:
+        """Close every idle connection."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._discard(conn)
+
+
+# One relay pool per event loop; pooled connections are bound to the loop
+# that opened them
+_RELAY_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SMTPConnectionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_relay_pool() -> SMTPConnectionPool:
+    """Return the pool of connections to the configured mailserver for the running loop."""
+    loop = asyncio.get_running_loop()
+    pool = _RELAY_POOLS.get(loop)
+    if pool is None:
+        pool = _RELAY_POOLS[loop] = SMTPConnectionPool(
+            hostname=SETTINGS.MAILSERVER_HOST,
+            port=SETTINGS.MAILSERVER_PORT,
+            username=SETTINGS.MAILSERVER_USER,
+            password=SETTINGS.MAILSERVER_PASSWORD,
+            start_tls=SETTINGS.MAILSERVER_USE_TLS,
+            max_size=SETTINGS.MAILSERVER_POOL_SIZE,
+            max_messages=SETTINGS.MAILSERVER_POOL_MAX_MESSAGES,
+            timeout=SETTINGS.MAILSERVER_TIMEOUT_SECONDS,
+            connect_timeout=SETTINGS.MAILSERVER_CONNECT_TIMEOUT_SECONDS,
+        )
+    return pool
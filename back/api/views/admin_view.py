@@ -577,8 +577,8 @@ async def get_security_events(
     try:
         offset = (page - 1) * page_size
 
-        # Build query with filters
-        query = select(SecurityEvent)
+        # Build query with filters (plain rows; events are read-only here)
+        query = select(SecurityEvent.__table__)
 
         if event_type:
             query = query.where(SecurityEvent.event_type == event_type)
@@ -601,12 +601,12 @@ async def get_security_events(
         # Get events with pagination
         query = query.order_by(desc(SecurityEvent.event_timestamp)).offset(offset).limit(page_size)
         result = await db.execute(query)
-        events = result.scalars().all()
+        events = result.all()
 
         return {
             "success": True,
             "data": {
-                "items": [event.to_dict() for event in events],
+                "items": [SecurityEvent.row_to_dict(event) for event in events],
                 "total": total,
                 "page": page,
                 "page_size": page_size,
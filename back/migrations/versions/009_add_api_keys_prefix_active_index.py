@@ -0,0 +1,35 @@
+"""Add partial index on active API key prefixes
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # API key authentication only ever looks up active keys by prefix
+    op.create_index(
+        'ix_api_keys_prefix_active',
+        'api_keys',
+        ['prefix'],
+        unique=False,
+        postgresql_where=sa.text('is_active')
+    )
+    # The full prefix index from 006 is now only extra write cost
+    op.drop_index(op.f('ix_api_keys_prefix'), table_name='api_keys')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_api_keys_prefix'), 'api_keys', ['prefix'], unique=False)
+    op.drop_index('ix_api_keys_prefix_active', table_name='api_keys')
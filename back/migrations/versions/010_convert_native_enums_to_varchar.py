@@ -0,0 +1,60 @@
+"""Convert native enum columns to VARCHAR with CHECK constraints
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, enum type / constraint name, length, allowed values, server default)
+ENUM_COLUMNS = [
+    ('messages', 'status', 'messagestatus', 20,
+     ['PENDING', 'PROCESSING', 'DELIVERED', 'FAILED', 'BOUNCED', 'REJECTED'], None),
+    ('users', 'role', 'userrole', 10, ['ADMIN', 'USER'], 'USER'),
+    ('forwarding_rules', 'condition_type', 'ruleconditiontype', 32,
+     ['SENDER_CONTAINS', 'SENDER_EQUALS', 'SENDER_DOMAIN', 'SUBJECT_CONTAINS',
+      'SUBJECT_EQUALS', 'SIZE_GREATER_THAN', 'SIZE_LESS_THAN', 'HAS_ATTACHMENTS'], None),
+    ('forwarding_rules', 'action_type', 'ruleactiontype', 16, ['FORWARD', 'BLOCK', 'REDIRECT'], None),
+]
+
+
+def _values_sql(values: list[str]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    for table, column, name, length, values, default in ENUM_COLUMNS:
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE VARCHAR({length}) USING {column}::text'
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+        op.execute(f'DROP TYPE IF EXISTS {name}')
+        op.create_check_constraint(name, table, f"{column} IN ({_values_sql(values)})")
+
+
+def downgrade() -> None:
+    for table, column, name, _length, values, default in reversed(ENUM_COLUMNS):
+        op.drop_constraint(name, table, type_='check')
+        op.execute(f'CREATE TYPE {name} AS ENUM ({_values_sql(values)})')
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE {name} USING {column}::{name}'
+        )
+        if default is not None:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
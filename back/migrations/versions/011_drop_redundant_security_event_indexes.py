@@ -0,0 +1,27 @@
+"""Drop single-column security event indexes covered by composites
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covered by idx_security_events_severity_timestamp and idx_security_events_ip_type
+    op.drop_index(op.f('ix_security_events_severity'), table_name='security_events')
+    op.drop_index(op.f('ix_security_events_ip_address'), table_name='security_events')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_security_events_ip_address'), 'security_events', ['ip_address'], unique=False)
+    op.create_index(op.f('ix_security_events_severity'), 'security_events', ['severity'], unique=False)
@@ -0,0 +1,29 @@
+"""Store session device info and security event metadata as JSONB
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE sessions ALTER COLUMN device_info TYPE JSONB USING device_info::jsonb')
+    op.execute(
+        'ALTER TABLE security_events ALTER COLUMN event_metadata '
+        "TYPE JSONB USING NULLIF(event_metadata, '')::jsonb"
+    )
+
+
+def downgrade() -> None:
+    op.execute('ALTER TABLE security_events ALTER COLUMN event_metadata TYPE TEXT USING event_metadata::text')
+    op.execute('ALTER TABLE sessions ALTER COLUMN device_info TYPE JSON USING device_info::json')
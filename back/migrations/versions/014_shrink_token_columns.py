@@ -0,0 +1,43 @@
+"""Shrink token columns and drop indexes duplicating their unique constraints
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TOKEN_TABLES = ['password_reset_tokens', 'email_verification_tokens']
+
+
+def upgrade() -> None:
+    for table in TOKEN_TABLES:
+        # The UNIQUE constraint on token already provides a b-tree for lookups
+        op.drop_index(op.f(f'ix_{table}_token'), table_name=table)
+        op.alter_column(
+            table, 'token',
+            existing_type=sa.String(length=255),
+            type_=sa.String(length=64),
+            existing_nullable=False
+        )
+
+
+def downgrade() -> None:
+    for table in TOKEN_TABLES:
+        op.alter_column(
+            table, 'token',
+            existing_type=sa.String(length=64),
+            type_=sa.String(length=255),
+            existing_nullable=False
+        )
+        op.create_index(op.f(f'ix_{table}_token'), table, ['token'], unique=False)
@@ -0,0 +1,36 @@
+"""Replace user_id indexes on sessions/api_keys with user/active/expiry composites
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_sessions_user_active', 'sessions', ['user_id', 'is_active', 'expires_at'], unique=False
+    )
+    op.create_index(
+        'ix_api_keys_user_active', 'api_keys', ['user_id', 'is_active', 'expires_at'], unique=False
+    )
+
+    # user_id is the leading column of the composites
+    op.drop_index(op.f('ix_sessions_user_id'), table_name='sessions')
+    op.drop_index(op.f('ix_api_keys_user_id'), table_name='api_keys')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_api_keys_user_id'), 'api_keys', ['user_id'], unique=False)
+    op.create_index(op.f('ix_sessions_user_id'), 'sessions', ['user_id'], unique=False)
+    op.drop_index('ix_api_keys_user_active', table_name='api_keys')
+    op.drop_index('ix_sessions_user_active', table_name='sessions')
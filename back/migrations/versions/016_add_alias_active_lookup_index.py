@@ -0,0 +1,31 @@
+"""Add partial index for live alias lookup by domain and local part
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_aliases_active_lookup',
+        'aliases',
+        ['domain_id', 'local_part'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_deleted')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_aliases_active_lookup', table_name='aliases')
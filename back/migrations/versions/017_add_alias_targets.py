@@ -0,0 +1,44 @@
+"""Add alias_targets table with one row per alias destination
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('alias_targets',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('alias_id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(length=320), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('bounce_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['alias_id'], ['aliases.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('alias_id', 'email', name='uq_alias_targets_alias_email')
+    )
+    op.create_index(op.f('ix_alias_targets_email'), 'alias_targets', ['email'], unique=False)
+
+    # Split the existing comma-separated targets into rows
+    op.execute(
+        "INSERT INTO alias_targets (alias_id, email) "
+        "SELECT DISTINCT a.id, trim(t.email) "
+        "FROM aliases a, unnest(string_to_array(a.targets, ',')) AS t(email) "
+        "WHERE trim(t.email) <> ''"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_alias_targets_email'), table_name='alias_targets')
+    op.drop_table('alias_targets')
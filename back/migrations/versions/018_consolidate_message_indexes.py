@@ -0,0 +1,38 @@
+"""Consolidate duplicate message indexes into a status/created_at composite
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Status filters are always combined with a created_at window or ordering
+    op.create_index(
+        'idx_messages_status_created', 'messages', ['status', 'created_at'], unique=False
+    )
+
+    # 001 and 004 created the same single-column indexes twice, and
+    # domain_id alone is covered by idx_messages_domain_created
+    op.drop_index(op.f('ix_messages_created_at'), table_name='messages')
+    op.drop_index(op.f('ix_messages_status'), table_name='messages')
+    op.drop_index('idx_messages_status', table_name='messages')
+    op.drop_index(op.f('ix_messages_domain_id'), table_name='messages')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_messages_domain_id'), 'messages', ['domain_id'], unique=False)
+    op.create_index('idx_messages_status', 'messages', ['status'], unique=False)
+    op.create_index(op.f('ix_messages_status'), 'messages', ['status'], unique=False)
+    op.create_index(op.f('ix_messages_created_at'), 'messages', ['created_at'], unique=False)
+    op.drop_index('idx_messages_status_created', table_name='messages')
@@ -0,0 +1,33 @@
+"""Index forwarding rules by alias and priority
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rules are always read per alias in priority order (inbound routing and
+    # the rules API); alias_id leads, so the FK cascade is still covered
+    op.create_index(
+        'ix_forwarding_rules_alias_priority',
+        'forwarding_rules',
+        ['alias_id', 'priority'],
+        unique=False
+    )
+    op.drop_index(op.f('ix_forwarding_rules_alias_id'), table_name='forwarding_rules')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_forwarding_rules_alias_id'), 'forwarding_rules', ['alias_id'], unique=False)
+    op.drop_index('ix_forwarding_rules_alias_priority', table_name='forwarding_rules')
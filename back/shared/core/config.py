@@ -30,6 +30,17 @@ class Settings(BaseSettings):
         default="change-this-secret-key-in-production",
         description="Secret key for session management"
     )
+    BCRYPT_ROUNDS_PASSWORD: int = Field(
+        default=12, description="bcrypt cost factor for user passwords"
+    )
+    API_KEY_PEPPER: str = Field(
+        default="",
+        description="HMAC pepper for API key hashes (falls back to SECRET_KEY; changing it invalidates keys)"
+    )
+
+    SESSION_CLEANUP_INTERVAL_SECONDS: int = Field(
+        default=3600, description="Interval between expired session sweeps (0 disables)"
+    )
 
     # Stripe Configuration
     STRIPE_API_KEY: str = Field(default="", description="Stripe API key")
@@ -61,10 +72,19 @@ class Settings(BaseSettings):
     MAILSERVER_USER: str = Field(default="", description="Mailserver username (if auth required)")
     MAILSERVER_PASSWORD: str = Field(default="", description="Mailserver password (if auth required)")
     MAILSERVER_USE_TLS: bool = Field(default=True, description="Use STARTTLS for mailserver connection")
+    MAILSERVER_POOL_SIZE: int = Field(default=5, description="Maximum open connections to the mailserver")
+    MAILSERVER_POOL_MAX_MESSAGES: int = Field(default=100, description="Messages sent before a pooled connection is recycled")
+    MAILSERVER_CONNECT_TIMEOUT_SECONDS: float = Field(default=10.0, description="Timeout for dialing the mailserver and for idle-connection probes")
+    MAILSERVER_TIMEOUT_SECONDS: float = Field(default=60.0, description="Timeout for each SMTP command on an open mailserver connection")
 
     # SMTP Receiver Configuration (for receiving emails from mailserver)
     SMTP_RECEIVER_HOST: str = Field(default="0.0.0.0", description="SMTP receiver bind address")
     SMTP_RECEIVER_PORT: int = Field(default=2525, description="SMTP receiver port")
+    SMTP_MAX_RECIPIENTS: int = Field(default=100, description="Maximum RCPT TO addresses accepted per message")
+    SMTP_RECIPIENT_CACHE_TTL_SECONDS: float = Field(default=60.0, description="How long a resolved alias/catch-all route is reused")
+    SMTP_RECIPIENT_CACHE_NEGATIVE_TTL_SECONDS: float = Field(default=15.0, description="How long an unknown domain or alias is remembered")
+    SMTP_RECIPIENT_CACHE_MAX_SIZE: int = Field(default=10000, description="Maximum cached recipient routes")
+    SMTP_DOMAIN_CACHE_TTL_SECONDS: float = Field(default=30.0, description="How long the set of hosted domain names is reused")
 
     # Application URLs
     APP_URL: str = Field(default="http://localhost:4200", description="Frontend application URL")
@@ -1,7 +1,9 @@
 """Security and session middlewares for SMTPy API."""
 from __future__ import annotations
 
+import math
 import time
+from collections import OrderedDict
 from typing import Callable, Awaitable, Optional
 
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -81,18 +83,23 @@ class SessionTimeoutMiddleware(BaseHTTPMiddleware):
 class SimpleRateLimiter(BaseHTTPMiddleware):
     """Very small in-memory rate limiter for low-traffic/dev usage.
 
-    Limits requests per key (IP or custom key) within a sliding window.
+    Token bucket per key (IP or custom key): each key may burst up to
+    ``requests`` calls and refills at ``requests / window_seconds`` per second.
+    At most ``max_keys`` buckets are kept, least recently used evicted first.
     Not suitable for multi-process or production use without shared storage.
     """
 
     def __init__(self, app, *, requests: int, window_seconds: int, key_func: Optional[Callable[[Request], str]] = None,
-                 paths: Optional[list[str]] = None) -> None:
+                 paths: Optional[list[str]] = None, max_keys: int = 10000) -> None:
         super().__init__(app)
         self.max_requests = requests
         self.window = window_seconds
+        self.rate = requests / window_seconds
         self.key_func = key_func or (lambda r: r.client.host if r.client else "unknown")
         self.paths = set(paths or [])
-        self._hits: dict[str, list[float]] = {}
+        self.max_keys = max_keys
+        # key -> [tokens, last_refill (monotonic seconds)]
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
 
     def _is_scoped(self, path: str) -> bool:
         if not self.paths:
@@ -100,26 +107,31 @@ class SimpleRateLimiter(BaseHTTPMiddleware):
         # Simple exact match; could be enhanced to prefix match
         return path in self.paths
 
+    def _take(self, key: str) -> float:
+        """Consume one token for ``key``; return 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [float(self.max_requests), now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(float(self.max_requests), bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] < 1:
+            return (1 - bucket[0]) / self.rate
+        bucket[0] -= 1
+        return 0.0
+
     async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
         if self._is_scoped(request.url.path):
-            key = self.key_func(request)
-            now = time.time()
-            hits = self._hits.setdefault(key, [])
-            # drop old hits outside window
-            cutoff = now - self.window
-            i = 0
-            for ts in hits:
-                if ts >= cutoff:
-                    break
-                i += 1
-            if i:
-                del hits[:i]
-            if len(hits) >= self.max_requests:
-                retry_after = int(hits[0] + self.window - now)
+            retry_after = self._take(self.key_func(request))
+            if retry_after:
                 return JSONResponse(
                     {"detail": "Too many requests"},
                     status_code=429,
-                    headers={"Retry-After": str(max(retry_after, 1))},
+                    headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
                 )
-            hits.append(now)
         return await call_next(request)
@@ -1,6 +1,6 @@
 """Models package for SMTPy v2."""
 
-from .base import Base, TimestampMixin
+from .base import Base, ExpirableMixin, TimestampMixin
 from .organization import Organization
 from .user import User, UserRole, PasswordResetToken, EmailVerificationToken
 from .user_preferences import UserPreferences
@@ -10,6 +10,7 @@ from .domain import Domain
 from .message import Message, MessageStatus
 from .event import Event
 from .alias import Alias
+from .alias_target import AliasTarget
 from .activity_log import ActivityLog
 from .forwarding_rule import ForwardingRule, RuleConditionType, RuleActionType
 from .security_event import SecurityEvent, EventType, EventSeverity
@@ -17,6 +18,7 @@ from .security_event import SecurityEvent, EventType, EventSeverity
 __all__ = [
     "Base",
     "TimestampMixin",
+    "ExpirableMixin",
     "Organization",
     "User",
     "UserRole",
@@ -30,6 +32,7 @@ __all__ = [
     "MessageStatus",
     "Event",
     "Alias",
+    "AliasTarget",
     "ActivityLog",
     "ForwardingRule",
     "RuleConditionType",
@@ -1,13 +1,17 @@
 """Alias model for email forwarding."""
 
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, relationship
 
 from .base import Base, TimestampMixin
 
+if TYPE_CHECKING:
+    from .alias_target import AliasTarget
+    from .domain import Domain
+
 
 class Alias(Base, TimestampMixin):
     """Email alias model for forwarding emails to target addresses."""
@@ -27,7 +31,7 @@ class Alias(Base, TimestampMixin):
         String(255), nullable=False, doc="Local part of the email (before @)"
     )
 
-    # Target addresses (comma-separated)
+    # Target addresses (comma-separated copy of the alias_targets rows)
     targets: Mapped[str] = Column(
         Text, nullable=False, doc="Comma-separated list of target email addresses"
     )
@@ -41,7 +45,20 @@ class Alias(Base, TimestampMixin):
     )
 
     # Relationships
-    domain: Mapped["Domain"] = relationship("Domain", lazy="selectin")
+    # Many-to-one read on nearly every alias access; load it in the same query
+    domain: Mapped["Domain"] = relationship("Domain", lazy="joined", innerjoin=True)
+    target_entries: Mapped[list["AliasTarget"]] = relationship(
+        "AliasTarget", back_populates="alias", lazy="raise_on_sql", passive_deletes=True
+    )
+
+    __table_args__ = (
+        # Inbound mail resolves RCPT TO against live aliases only
+        Index(
+            'ix_aliases_active_lookup', 'domain_id', 'local_part',
+            postgresql_where=text('NOT is_deleted'),
+            sqlite_where=text('is_deleted = 0'),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<Alias(id={self.id}, local_part='{self.local_part}', domain_id={self.domain_id})>"
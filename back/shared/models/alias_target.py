@@ -0,0 +1,48 @@
+"""Alias target model: one row per forwarding destination of an alias."""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, relationship
+
+from .base import Base
+
+if TYPE_CHECKING:
+    from .alias import Alias
+
+
+class AliasTarget(Base):
+    """Normalized forwarding destination for an alias.
+
+    Alias.targets keeps the comma-separated copy used by existing call sites;
+    these rows make targets queryable and carry per-target delivery state.
+    """
+
+    __tablename__ = "alias_targets"
+
+    # Primary key
+    id: Mapped[int] = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Alias relationship
+    alias_id: Mapped[int] = Column(
+        Integer, ForeignKey("aliases.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Destination address, indexed for "which aliases forward to X" lookups
+    email: Mapped[str] = Column(String(320), nullable=False, index=True)
+
+    # Delivery state
+    is_active: Mapped[bool] = Column(Boolean, nullable=False, default=True)
+    bounce_count: Mapped[int] = Column(Integer, nullable=False, default=0)
+
+    # Relationships
+    alias: Mapped["Alias"] = relationship(
+        "Alias", back_populates="target_entries", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        UniqueConstraint('alias_id', 'email', name='uq_alias_targets_alias_email'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<AliasTarget(id={self.id}, alias_id={self.alias_id}, email='{self.email}')>"
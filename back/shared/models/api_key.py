@@ -1,20 +1,39 @@
 """API Key model for SMTPy v2."""
 
+import asyncio
+import base64
 import bcrypt
+import hashlib
+import hmac
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Union
 
-from sqlalchemy import Boolean, String, Integer, DateTime, ForeignKey, Column
+from sqlalchemy import Boolean, String, Integer, DateTime, ForeignKey, Column, Index, text
 from sqlalchemy.orm import Mapped, relationship
 
-from .base import Base, TimestampMixin
+from ..core.config import SETTINGS
+from .base import Base, ExpirableMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from .user import User
 
+# Short-lived cache of legacy keys that already passed bcrypt verification.
+# Maps sha256(full_key) -> (api_key_id, monotonic expiry).
+VERIFIED_KEY_CACHE_TTL = 30.0
+VERIFIED_KEY_CACHE_MAX_SIZE = 1024
+_VERIFIED_KEY_CACHE: "OrderedDict[bytes, tuple[int, float]]" = OrderedDict()
+_VERIFIED_KEY_CACHE_LOCK = threading.Lock()
 
-class APIKey(Base, TimestampMixin):
+# Keyed HMAC state for the current pepper; copying it skips re-deriving the
+# inner/outer pads on every hash. Rebuilt if the pepper setting changes.
+_HMAC_BASE: Optional[tuple[bytes, "hmac.HMAC"]] = None
+
+
+class APIKey(Base, TimestampMixin, ExpirableMixin):
     """API Key for programmatic access."""
 
     __tablename__ = "api_keys"
@@ -26,8 +45,7 @@ class APIKey(Base, TimestampMixin):
     user_id: Mapped[int] = Column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
-        doc="User ID"
+        doc="User ID (indexed via the composite user/active/expiry index)"
     )
 
     # API key details
@@ -35,10 +53,10 @@ class APIKey(Base, TimestampMixin):
         String(100), nullable=False, doc="User-defined name for the key"
     )
     key_hash: Mapped[str] = Column(
-        String(255), nullable=False, doc="Hashed API key (bcrypt)"
+        String(255), nullable=False, doc="Hashed API key (HMAC-SHA256 hex, or legacy bcrypt)"
     )
     prefix: Mapped[str] = Column(
-        String(16), nullable=False, index=True, doc="Key prefix for identification (e.g., smtpy_sk_abc12345)"
+        String(16), nullable=False, doc="Key prefix for identification (e.g., smtpy_sk_abc12345)"
     )
 
     # Status and usage
@@ -55,7 +73,32 @@ class APIKey(Base, TimestampMixin):
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="api_keys", lazy="selectin")
+    user: Mapped["User"] = relationship("User", back_populates="api_keys", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # Authentication looks up active keys by prefix only
+        Index('ix_api_keys_prefix_active', 'prefix', postgresql_where=text('is_active')),
+        # "List my keys" filters on user and status
+        Index('ix_api_keys_user_active', 'user_id', 'is_active', 'expires_at'),
+    )
+
+    @staticmethod
+    def hash_key(key: Union[str, bytes]) -> str:
+        """Hash an API key with HMAC-SHA256 keyed by the server-side pepper."""
+        global _HMAC_BASE
+
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+
+        pepper = (SETTINGS.API_KEY_PEPPER or SETTINGS.SECRET_KEY).encode('utf-8')
+        base = _HMAC_BASE
+        if base is None or base[0] != pepper:
+            base = (pepper, hmac.new(pepper, digestmod=hashlib.sha256))
+            _HMAC_BASE = base
+
+        mac = base[1].copy()
+        mac.update(key)
+        return mac.hexdigest()
 
     @staticmethod
     def generate_key() -> tuple[str, str, str]:
@@ -65,52 +108,129 @@ class APIKey(Base, TimestampMixin):
         Returns:
             tuple: (full_key, key_hash, prefix)
                 - full_key: The complete API key to return to user (only shown once)
-                - key_hash: Bcrypt hash to store in database
+                - key_hash: HMAC-SHA256 hash to store in database
                 - prefix: First 16 chars for identification
         """
-        # Generate random key: smtpy_sk_{32 random chars}
-        random_part = secrets.token_urlsafe(32)
-        full_key = f"smtpy_sk_{random_part}"
+        # Generate random key: smtpy_sk_{43 URL-safe base64 chars from 32 random bytes}
+        random_part = base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b'=')
+        full_key_bytes = b"smtpy_sk_" + random_part
+        full_key = full_key_bytes.decode('ascii')
 
         # Extract prefix (first 16 chars including smtpy_sk_)
         prefix = full_key[:16]
 
-        # Hash the full key
-        salt = bcrypt.gensalt()
-        key_hash = bcrypt.hashpw(full_key.encode('utf-8'), salt).decode('utf-8')
+        # The key is 256 bits of randomness, so a keyed fast hash is enough;
+        # bcrypt's work factor only matters for human-chosen passwords
+        key_hash = APIKey.hash_key(full_key_bytes)
 
         return full_key, key_hash, prefix
 
-    def verify_key(self, key: str) -> bool:
-        """Verify an API key against the stored hash."""
+    def verify_key(self, key: str, presented_hash: Optional[str] = None) -> bool:
+        """
+        Verify an API key against the stored hash.
+
+        Callers checking one key against several candidate rows can pass
+        ``presented_hash`` (from hash_key) so the key is only hashed once.
+
+        Keys created before the switch to HMAC-SHA256 still carry a bcrypt hash;
+        those are verified with bcrypt and re-hashed in place. The caller must
+        commit the changed key_hash to persist the upgrade, as
+        UsersDatabase.verify_api_key does.
+        """
+        if not self.key_hash:
+            return False
+
+        if not self.key_hash.startswith("$2"):
+            return hmac.compare_digest(self.key_hash, presented_hash or APIKey.hash_key(key))
+
+        return self._verify_legacy_key(key)
+
+    async def averify_key(self, key: str, presented_hash: Optional[str] = None) -> bool:
+        """
+        Verify an API key, running legacy bcrypt checks in a worker thread.
+
+        A legacy key keeps paying for bcrypt (outside the short verification
+        cache) until the caller commits its upgraded key_hash.
+        """
+        if self.key_hash and self.key_hash.startswith("$2"):
+            return await asyncio.to_thread(self._verify_legacy_key, key)
+        return self.verify_key(key, presented_hash)
+
+    def _verify_legacy_key(self, key: str) -> bool:
+        """
+        Verify a legacy bcrypt-hashed key and upgrade it to HMAC-SHA256.
+
+        Successful verifications are cached for VERIFIED_KEY_CACHE_TTL seconds so
+        repeated requests with the same key skip bcrypt until the upgraded hash
+        is persisted.
+        """
+        cache_key = hashlib.sha256(key.encode('utf-8')).digest()
+        now = time.monotonic()
+
+        with _VERIFIED_KEY_CACHE_LOCK:
+            entry = _VERIFIED_KEY_CACHE.get(cache_key)
+            if entry is not None:
+                key_id, expiry = entry
+                if key_id == self.id and now < expiry:
+                    _VERIFIED_KEY_CACHE.move_to_end(cache_key)
+                    self.key_hash = APIKey.hash_key(key)
+                    return True
+                del _VERIFIED_KEY_CACHE[cache_key]
+
         try:
-            return bcrypt.checkpw(key.encode('utf-8'), self.key_hash.encode('utf-8'))
+            matches = bcrypt.checkpw(key.encode('utf-8'), self.key_hash.encode('utf-8'))
         except Exception:
             return False
 
-    def is_valid(self) -> bool:
-        """Check if API key is valid (active and not expired)."""
-        if not self.is_active:
-            return False
+        if matches:
+            self.key_hash = APIKey.hash_key(key)
+
+            if self.id is not None:
+                with _VERIFIED_KEY_CACHE_LOCK:
+                    _VERIFIED_KEY_CACHE[cache_key] = (self.id, now + VERIFIED_KEY_CACHE_TTL)
+                    _VERIFIED_KEY_CACHE.move_to_end(cache_key)
+                    while len(_VERIFIED_KEY_CACHE) > VERIFIED_KEY_CACHE_MAX_SIZE:
+                        _VERIFIED_KEY_CACHE.popitem(last=False)
+
+        return matches
 
-        if self.expires_at:
-            from datetime import timezone
-            return self.expires_at > datetime.now(timezone.utc)
+    @classmethod
+    def invalidate(cls, key_or_id: Union[str, int]) -> None:
+        """Drop cached verifications for a full key string or an API key ID."""
+        with _VERIFIED_KEY_CACHE_LOCK:
+            if isinstance(key_or_id, str):
+                _VERIFIED_KEY_CACHE.pop(hashlib.sha256(key_or_id.encode('utf-8')).digest(), None)
+                return
 
-        return True
+            stale = [k for k, (key_id, _) in _VERIFIED_KEY_CACHE.items() if key_id == key_or_id]
+            for k in stale:
+                del _VERIFIED_KEY_CACHE[k]
+
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
+        """Check if API key is valid (active and not expired).
+
+        Pass ``now`` when validating many keys so they share one clock read.
+        """
+        return bool(self.is_active) and not self.is_expired(now)
 
     def to_dict(self, include_key: bool = False) -> dict:
         """Convert API key to dictionary for API responses."""
+        # Read each optional timestamp once; instrumented attribute access isn't free
+        last_used_at = self.last_used_at
+        expires_at = self.expires_at
+        created_at = self.created_at
+        updated_at = self.updated_at
+
         data = {
             "id": self.id,
             "user_id": self.user_id,
             "name": self.name,
             "prefix": self.prefix,
             "is_active": self.is_active,
-            "last_used_at": self.last_used_at.isoformat() if self.last_used_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "last_used_at": last_used_at.isoformat() if last_used_at else None,
+            "expires_at": expires_at.isoformat() if expires_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
         }
 
         # Never include the full key or hash in normal responses
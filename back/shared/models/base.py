@@ -1,6 +1,7 @@
 """Base models for SMTPy v2."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
 
 from sqlalchemy import DateTime, func, Column
 from sqlalchemy.ext.asyncio import AsyncAttrs
@@ -12,19 +13,40 @@ class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
+def utcnow() -> datetime:
+    """Return the current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+class ExpirableMixin:
+    """Mixin for models with an ``expires_at`` timestamp."""
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        """Check if the record has expired (records without expires_at never expire).
+
+        Pass ``now`` when checking many records so they share one clock read.
+        """
+        expires_at = self.expires_at
+        return expires_at is not None and expires_at <= (now or utcnow())
+
+
 class TimestampMixin:
-    """Mixin for created_at and updated_at timestamps."""
+    """Mixin for created_at and updated_at timestamps.
+
+    Defaults are generated by the database, so Core-level bulk inserts get
+    them too; the ORM reads them back through INSERT ... RETURNING.
+    """
 
     created_at: Mapped[datetime] = Column(
         DateTime(timezone=True),
-        default=func.now(),
+        server_default=func.now(),
         nullable=False,
         doc="Record creation timestamp"
     )
 
     updated_at: Mapped[datetime] = Column(
         DateTime(timezone=True),
-        default=func.now(),
+        server_default=func.now(),
         onupdate=func.now(),
         nullable=False,
         doc="Record last update timestamp"
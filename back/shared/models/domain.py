@@ -4,7 +4,7 @@ import enum
 from typing import Optional
 
 from sqlalchemy import Boolean, Enum, ForeignKey, Integer, String, Text, Column
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy.orm import Mapped, deferred, relationship
 
 from .base import Base, TimestampMixin
 
@@ -60,8 +60,10 @@ class Domain(Base, TimestampMixin):
     dkim_public_key: Mapped[Optional[str]] = Column(
         Text, nullable=True, doc="DKIM public key for DNS TXT record (base64)"
     )
-    dkim_private_key: Mapped[Optional[str]] = Column(
-        Text, nullable=True, doc="DKIM private key for email signing (PEM format, encrypted)"
+    # Only ever written; kept out of every SELECT and raises if read implicitly
+    dkim_private_key: Mapped[Optional[str]] = deferred(
+        Column(Text, nullable=True, doc="DKIM private key for email signing (PEM format, encrypted)"),
+        raiseload=True,
     )
     dkim_selector: Mapped[Optional[str]] = Column(
         String(63), nullable=True, default="default", doc="DKIM selector (subdomain)"
@@ -77,7 +79,7 @@ class Domain(Base, TimestampMixin):
 
     # Relationships
     organization: Mapped["Organization"] = relationship(
-        "Organization", back_populates="domains", lazy="selectin"
+        "Organization", back_populates="domains", lazy="raise_on_sql"
     )
 
     @property
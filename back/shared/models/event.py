@@ -2,14 +2,16 @@
 
 import enum
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text, func, Column
 from sqlalchemy.orm import Mapped, relationship
 
-from . import Organization
 from .base import Base, TimestampMixin
 
+if TYPE_CHECKING:
+    from .organization import Organization
+
 
 class EventType(enum.Enum):
     """System event types."""
@@ -78,7 +80,7 @@ class BillingWebhookEvent(Base):
     # Timestamp
     received_at: Mapped[datetime] = Column(
         DateTime(timezone=True),
-        default=func.now(),
+        server_default=func.now(),
         nullable=False,
         doc="When webhook was received"
     )
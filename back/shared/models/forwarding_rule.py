@@ -3,7 +3,7 @@
 import enum
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, relationship
 
 from .base import Base, TimestampMixin
@@ -41,7 +41,7 @@ class ForwardingRule(Base, TimestampMixin):
 
     # Alias relationship
     alias_id: Mapped[int] = Column(
-        Integer, ForeignKey("aliases.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("aliases.id", ondelete="CASCADE"), nullable=False
     )
 
     # Rule ordering (lower priority = evaluated first)
@@ -59,7 +59,9 @@ class ForwardingRule(Base, TimestampMixin):
 
     # Condition
     condition_type: Mapped[RuleConditionType] = Column(
-        Enum(RuleConditionType), nullable=False, doc="Type of condition to evaluate"
+        Enum(RuleConditionType, native_enum=False, length=32, create_constraint=True, name="ruleconditiontype"),
+        nullable=False,
+        doc="Type of condition to evaluate"
     )
     condition_value: Mapped[str] = Column(
         Text, nullable=False, doc="Value to match against (e.g., 'example.com', 'spam', '1048576')"
@@ -67,7 +69,9 @@ class ForwardingRule(Base, TimestampMixin):
 
     # Action
     action_type: Mapped[RuleActionType] = Column(
-        Enum(RuleActionType), nullable=False, doc="Action to take when condition matches"
+        Enum(RuleActionType, native_enum=False, length=16, create_constraint=True, name="ruleactiontype"),
+        nullable=False,
+        doc="Action to take when condition matches"
     )
     action_value: Mapped[Optional[str]] = Column(
         Text, nullable=True, doc="Email address(es) for FORWARD/REDIRECT actions (comma-separated)"
@@ -84,7 +88,12 @@ class ForwardingRule(Base, TimestampMixin):
     )
 
     # Relationships
-    alias: Mapped["Alias"] = relationship("Alias", lazy="selectin")
+    alias: Mapped["Alias"] = relationship("Alias", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # Rules are read per alias in evaluation order
+        Index('ix_forwarding_rules_alias_priority', 'alias_id', 'priority'),
+    )
 
     def __repr__(self) -> str:
         return f"<ForwardingRule(id={self.id}, name='{self.name}', alias_id={self.alias_id})>"
@@ -1,14 +1,16 @@
 """Message model for SMTPy v2."""
 
 import enum
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy import Boolean, Enum, ForeignKey, Integer, String, Text, Column
 from sqlalchemy.orm import Mapped, relationship
 
-from . import Domain
 from .base import Base, TimestampMixin
 
+if TYPE_CHECKING:
+    from .domain import Domain
+
 
 class MessageStatus(enum.Enum):
     """Message processing status."""
@@ -59,7 +61,9 @@ class Message(Base, TimestampMixin):
     
     # Processing status
     status: Mapped[MessageStatus] = Column(
-        Enum(MessageStatus), nullable=False, default=MessageStatus.PENDING
+        Enum(MessageStatus, native_enum=False, length=20, create_constraint=True, name="messagestatus"),
+        nullable=False,
+        default=MessageStatus.PENDING
     )
     error_message: Mapped[Optional[str]] = Column(
         Text, nullable=True, doc="Error message if processing failed"
@@ -74,7 +78,7 @@ class Message(Base, TimestampMixin):
     )
     
     # Relationships
-    domain: Mapped["Domain"] = relationship("Domain", lazy="selectin")
+    domain: Mapped["Domain"] = relationship("Domain", lazy="raise_on_sql")
     
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, message_id='{self.message_id}', status='{self.status.value}')>"
\ No newline at end of file
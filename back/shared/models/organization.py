@@ -55,10 +55,11 @@ class Organization(Base, TimestampMixin):
     
     # Relationships
     domains: Mapped[list["Domain"]] = relationship(
-        "Domain", back_populates="organization", lazy="selectin", cascade="all, delete-orphan"
+        "Domain", back_populates="organization", lazy="raise_on_sql",
+        cascade="all, delete-orphan", passive_deletes=True
     )
     users: Mapped[list["User"]] = relationship(
-        "User", back_populates="organization", lazy="selectin"
+        "User", back_populates="organization", lazy="raise_on_sql", passive_deletes=True
     )
 
     def __repr__(self) -> str:
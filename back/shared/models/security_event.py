@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import String, DateTime, Text, Index, Integer
+from sqlalchemy import JSON, String, DateTime, Text, Index, Integer
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base, TimestampMixin
@@ -56,7 +57,6 @@ class SecurityEvent(Base, TimestampMixin):
     severity: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        index=True,
         default=EventSeverity.MEDIUM.value,
         doc="Severity level (low, medium, high, critical)"
     )
@@ -65,7 +65,6 @@ class SecurityEvent(Base, TimestampMixin):
     ip_address: Mapped[str] = mapped_column(
         String(45),  # IPv6 max length
         nullable=False,
-        index=True,
         doc="Source IP address of the event"
     )
 
@@ -93,7 +92,6 @@ class SecurityEvent(Base, TimestampMixin):
     event_timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
         doc="When the event actually occurred"
     )
 
@@ -104,14 +102,16 @@ class SecurityEvent(Base, TimestampMixin):
         doc="Action taken in response to the event (blocked, rate-limited, etc.)"
     )
 
-    # Additional event metadata (JSON-serializable string)
-    event_metadata: Mapped[Optional[str]] = mapped_column(
-        Text,
+    # Additional event metadata (binary JSONB on PostgreSQL)
+    event_metadata: Mapped[Optional[dict[str, Any]]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"),
         nullable=True,
-        doc="Additional event metadata as JSON string"
+        doc="Additional event metadata"
     )
 
-    # Indexes for common queries
+    # Indexes for common queries. severity and ip_address lookups are served by the
+    # leading column of the composites; event_type keeps its own single-column index
+    # since it is only the second column of (ip_address, event_type).
     __table_args__ = (
         Index('idx_security_events_timestamp', 'event_timestamp'),
         Index('idx_security_events_ip_type', 'ip_address', 'event_type'),
@@ -120,19 +120,33 @@ class SecurityEvent(Base, TimestampMixin):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for API responses."""
+        return SecurityEvent.row_to_dict(self)
+
+    @staticmethod
+    def row_to_dict(row: Any) -> dict:
+        """Convert an event to a dictionary from an ORM instance or a Core row.
+
+        List endpoints select the table columns directly and serialize the rows
+        here, which avoids building an ORM instance per event.
+        """
+        # Read each optional timestamp once; instrumented attribute access isn't free
+        event_timestamp = row.event_timestamp
+        created_at = row.created_at
+        updated_at = row.updated_at
+
         return {
-            "id": self.id,
-            "event_type": self.event_type,
-            "severity": self.severity,
-            "ip_address": self.ip_address,
-            "port": self.port,
-            "service": self.service,
-            "details": self.details,
-            "event_timestamp": self.event_timestamp.isoformat() if self.event_timestamp else None,
-            "action_taken": self.action_taken,
-            "event_metadata": self.event_metadata,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "id": row.id,
+            "event_type": row.event_type,
+            "severity": row.severity,
+            "ip_address": row.ip_address,
+            "port": row.port,
+            "service": row.service,
+            "details": row.details,
+            "event_timestamp": event_timestamp.isoformat() if event_timestamp else None,
+            "action_taken": row.action_taken,
+            "event_metadata": row.event_metadata,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None
         }
 
     def __repr__(self) -> str:
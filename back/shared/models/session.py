@@ -3,16 +3,17 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING, Any
 
-from sqlalchemy import Boolean, String, Integer, DateTime, ForeignKey, Column, JSON
+from sqlalchemy import Boolean, String, Integer, DateTime, ForeignKey, Column, JSON, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, relationship
 
-from .base import Base, TimestampMixin
+from .base import Base, ExpirableMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from .user import User
 
 
-class Session(Base, TimestampMixin):
+class Session(Base, TimestampMixin, ExpirableMixin):
     """User session tracking for security and management."""
 
     __tablename__ = "sessions"
@@ -24,8 +25,7 @@ class Session(Base, TimestampMixin):
     user_id: Mapped[int] = Column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
-        doc="User ID"
+        doc="User ID (indexed via the composite user/active/expiry index)"
     )
 
     # Session details
@@ -35,7 +35,9 @@ class Session(Base, TimestampMixin):
 
     # Device and location info
     device_info: Mapped[Optional[dict[str, Any]]] = Column(
-        JSON, nullable=True, doc="Device information (browser, OS, etc.)"
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=True,
+        doc="Device information (browser, OS, etc.)"
     )
     ip_address: Mapped[Optional[str]] = Column(
         String(45), nullable=True, doc="IP address (supports IPv4 and IPv6)"
@@ -60,15 +62,21 @@ class Session(Base, TimestampMixin):
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="sessions", lazy="selectin")
+    user: Mapped["User"] = relationship("User", back_populates="sessions", lazy="raise_on_sql")
 
-    def is_valid(self) -> bool:
-        """Check if session is valid (active and not expired)."""
-        if not self.is_active:
-            return False
+    __table_args__ = (
+        # Expiry sweeps only ever look at live sessions
+        Index('ix_sessions_active_expires', 'expires_at', postgresql_where=text('is_active')),
+        # "List my sessions" filters on user and status
+        Index('ix_sessions_user_active', 'user_id', 'is_active', 'expires_at'),
+    )
+
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
+        """Check if session is valid (active and not expired).
 
-        from datetime import timezone
-        return self.expires_at > datetime.now(timezone.utc)
+        Pass ``now`` when validating many sessions so they share one clock read.
+        """
+        return bool(self.is_active) and not self.is_expired(now)
 
     def to_dict(self) -> dict:
         """Convert session to dictionary for API responses."""
@@ -1,14 +1,16 @@
 """User model for SMTPy v2."""
 
+import asyncio
 import enum
 import bcrypt
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import Boolean, Enum, Integer, String, DateTime, ForeignKey, Column
+from sqlalchemy import Boolean, Enum, Integer, String, DateTime, ForeignKey, Column, func
 from sqlalchemy.orm import Mapped, relationship
 
-from .base import Base, TimestampMixin
+from ..core.config import SETTINGS
+from .base import Base, ExpirableMixin, TimestampMixin
 
 if TYPE_CHECKING:
     from .organization import Organization
@@ -50,7 +52,10 @@ class User(Base, TimestampMixin):
         Boolean, nullable=False, default=False, doc="Is email verified"
     )
     role: Mapped[UserRole] = Column(
-        Enum(UserRole), nullable=False, default=UserRole.USER, doc="User role"
+        Enum(UserRole, native_enum=False, length=10, create_constraint=True, name="userrole"),
+        nullable=False,
+        default=UserRole.USER,
+        doc="User role"
     )
 
     # Organization relationship
@@ -70,29 +75,43 @@ class User(Base, TimestampMixin):
     organization: Mapped[Optional["Organization"]] = relationship(
         "Organization", back_populates="users", lazy="selectin"
     )
+    # Collections are loaded only on request via selectinload(); rows are removed by
+    # the database's ON DELETE CASCADE, so deleting a user never needs to load them
     preferences: Mapped[Optional["UserPreferences"]] = relationship(
-        "UserPreferences", back_populates="user", uselist=False, lazy="selectin", cascade="all, delete-orphan"
+        "UserPreferences", back_populates="user", uselist=False, lazy="raise_on_sql",
+        cascade="all, delete-orphan", passive_deletes=True
     )
     api_keys: Mapped[list["APIKey"]] = relationship(
-        "APIKey", back_populates="user", lazy="selectin", cascade="all, delete-orphan"
+        "APIKey", back_populates="user", lazy="raise_on_sql",
+        cascade="all, delete-orphan", passive_deletes=True
     )
     sessions: Mapped[list["Session"]] = relationship(
-        "Session", back_populates="user", lazy="selectin", cascade="all, delete-orphan"
+        "Session", back_populates="user", lazy="raise_on_sql",
+        cascade="all, delete-orphan", passive_deletes=True
     )
 
-    def set_password(self, password: str) -> None:
-        """Hash and set the user's password."""
-        salt = bcrypt.gensalt()
+    def set_password(self, password: str, rounds: Optional[int] = None) -> None:
+        """Hash and set the user's password (bcrypt cost defaults to BCRYPT_ROUNDS_PASSWORD)."""
+        salt = bcrypt.gensalt(rounds=rounds or SETTINGS.BCRYPT_ROUNDS_PASSWORD)
         self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
     def verify_password(self, password: str) -> bool:
         """Verify a password against the hash."""
         return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
 
+    async def aset_password(self, password: str, rounds: Optional[int] = None) -> None:
+        """Hash and set the password in a worker thread so the event loop isn't blocked."""
+        await asyncio.to_thread(self.set_password, password, rounds)
+
+    async def averify_password(self, password: str) -> bool:
+        """Verify a password in a worker thread so the event loop isn't blocked."""
+        return await asyncio.to_thread(self.verify_password, password)
+
     @property
     def is_admin(self) -> bool:
         """Check if user is an admin."""
-        return self.role == UserRole.ADMIN
+        # Enum members are singletons, and role always loads as a UserRole member
+        return self.role is UserRole.ADMIN
 
     def to_dict(self, include_sensitive: bool = False) -> dict:
         """Convert user to dictionary for API responses."""
@@ -115,7 +134,7 @@ class User(Base, TimestampMixin):
         return data
 
 
-class PasswordResetToken(Base):
+class PasswordResetToken(Base, ExpirableMixin):
     """Password reset token model."""
 
     __tablename__ = "password_reset_tokens"
@@ -124,27 +143,27 @@ class PasswordResetToken(Base):
     user_id: Mapped[int] = Column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
+    # secrets.token_urlsafe(32) is 43 chars; the unique constraint doubles as the lookup index
     token: Mapped[str] = Column(
-        String(255), nullable=False, unique=True, index=True
+        String(64), nullable=False, unique=True
     )
     expires_at: Mapped[datetime] = Column(
         DateTime(timezone=True), nullable=False, index=True
     )
     used: Mapped[bool] = Column(Boolean, nullable=False, default=False)
     created_at: Mapped[datetime] = Column(
-        DateTime(timezone=True), server_default="now()", nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", lazy="selectin")
 
-    def is_valid(self) -> bool:
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """Check if token is valid (not used and not expired)."""
-        from datetime import datetime, timezone
-        return not self.used and self.expires_at > datetime.now(timezone.utc)
+        return not self.used and not self.is_expired(now)
 
 
-class EmailVerificationToken(Base):
+class EmailVerificationToken(Base, ExpirableMixin):
     """Email verification token model."""
 
     __tablename__ = "email_verification_tokens"
@@ -153,21 +172,21 @@ class EmailVerificationToken(Base):
     user_id: Mapped[int] = Column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
+    # secrets.token_urlsafe(32) is 43 chars; the unique constraint doubles as the lookup index
     token: Mapped[str] = Column(
-        String(255), nullable=False, unique=True, index=True
+        String(64), nullable=False, unique=True
     )
     expires_at: Mapped[datetime] = Column(
         DateTime(timezone=True), nullable=False
     )
     used: Mapped[bool] = Column(Boolean, nullable=False, default=False)
     created_at: Mapped[datetime] = Column(
-        DateTime(timezone=True), server_default="now()", nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
     user: Mapped["User"] = relationship("User", lazy="selectin")
 
-    def is_valid(self) -> bool:
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """Check if token is valid (not used and not expired)."""
-        from datetime import datetime, timezone
-        return not self.used and self.expires_at > datetime.now(timezone.utc)
+        return not self.used and not self.is_expired(now)
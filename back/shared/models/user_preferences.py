@@ -51,7 +51,7 @@ class UserPreferences(Base, TimestampMixin):
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="preferences", lazy="selectin")
+    user: Mapped["User"] = relationship("User", back_populates="preferences", lazy="raise_on_sql")
 
     def to_dict(self) -> dict:
         """Convert preferences to dictionary for API responses."""
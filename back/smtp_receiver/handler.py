@@ -1,41 +1,201 @@
 """SMTP handler for processing incoming emails from Docker mailserver."""
 
+import asyncio
+import hashlib
 import logging
-import email
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass
 from email import policy
 from email.parser import BytesParser
-from typing import Optional, List, Tuple
+from typing import Dict, FrozenSet, Iterable, Optional, List, Tuple
 from aiosmtpd.smtp import SMTP as SMTPServer, Envelope, Session
 import aiosmtplib
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, select, tuple_, update
 
 from shared.core.config import SETTINGS
-from shared.models.message import Message, MessageStatus
+from shared.core.db import async_engine, async_sessionmaker_factory
+from shared.models.message import MessageStatus
 from shared.models.alias import Alias
+from shared.models.alias_target import AliasTarget
 from shared.models.domain import Domain
 from shared.models.user import User
 from shared.models.user_preferences import UserPreferences
 from shared.models.forwarding_rule import ForwardingRule, RuleConditionType, RuleActionType
 from api.services.email_service import EmailService
+from api.services.smtp_pool import get_relay_pool
+from .message_writer import MessageLogWriter
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for a recipient that is not in the resolution cache
+_CACHE_MISS = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRule:
+    """The ForwardingRule columns needed to evaluate a rule."""
+
+    id: int
+    name: str
+    condition_type: RuleConditionType
+    condition_value: str
+    action_type: RuleActionType
+    action_value: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedRecipient:
+    """Routing data for one recipient address, safe to reuse across messages."""
+
+    domain_id: int
+    organization_id: int
+    catch_all: Optional[str]
+    alias_id: Optional[int] = None
+    alias_targets: Optional[str] = None
+    # Active forwarding rules of the alias, in priority order
+    rules: Tuple[CachedRule, ...] = ()
+    # Catch-all addresses, or the alias's active alias_targets rows
+    default_targets: Tuple[str, ...] = ()
+
+
+# Messages larger than this are parsed in a worker thread; below it the
+# thread hand-off costs more than the parse
+_THREAD_PARSE_MIN_BYTES = 256 * 1024
+
+
+def _generated_message_id(raw_content: bytes) -> str:
+    """Stable Message-ID for a message without one (same bytes, same ID in every worker)."""
+    return f"<generated-{hashlib.blake2b(raw_content, digest_size=16).hexdigest()}@smtpy.local>"
+
+
+@dataclass(frozen=True, slots=True)
+class MessageMetadata:
+    """Header data of an inbound message, extracted by its single parse."""
+
+    subject: str
+    message_id: str
+    has_attachments: bool
+    size: int
+
+
+def _message_metadata(raw_content: bytes) -> MessageMetadata:
+    """Parse a message once for everything rules and storage need."""
+    parsed_message = BytesParser(policy=policy.default).parsebytes(raw_content)
+    return MessageMetadata(
+        subject=str(parsed_message.get("Subject", ""))[:500],
+        message_id=str(parsed_message.get("Message-ID") or _generated_message_id(raw_content)),
+        has_attachments=any(
+            part.get_content_disposition() == "attachment"
+            for part in parsed_message.walk()
+        ),
+        size=len(raw_content),
+    )
+
+
+def _split_targets(targets: str) -> List[str]:
+    """Split a comma-separated target list (validated when it was stored)."""
+    return [t for t in map(str.strip, targets.split(",")) if t]
+
+
+def _recipient_key(recipient: str) -> Optional[Tuple[str, str]]:
+    """Return the lowercased (domain, local_part) of an address, or None if malformed."""
+    # The domain follows the last "@"
+    local_part, at, domain_name = recipient.rpartition("@")
+    if not at or not local_part:
+        return None
+    return domain_name.lower(), local_part.lower()
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a relay failure may succeed on retry (4xx reply or a connection error)."""
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused):
+        return all(400 <= r.code < 500 for r in exc.recipients)
+    if isinstance(exc, aiosmtplib.SMTPResponseException):
+        return 400 <= exc.code < 500
+    # Anything else (e.g. a bug building the message) fails the same way on retry
+    return isinstance(exc, (
+        aiosmtplib.SMTPConnectError,
+        aiosmtplib.SMTPServerDisconnected,
+        aiosmtplib.SMTPTimeoutError,
+        asyncio.TimeoutError,
+        OSError,
+    ))
+
+
+# Headers the forwarder writes itself; copies in the incoming message are dropped
+FORWARD_REPLACED_HEADERS = frozenset({b"to", b"x-forwarded-by", b"x-original-to", b"x-original-sender"})
+
+
+def _header_line(name: str, value: str) -> bytes:
+    """Fold one header into wire bytes, RFC 2047-encoding any non-ASCII text."""
+    return policy.SMTP.header_factory(name, value).fold(policy=policy.SMTP).encode("ascii")
+
+
+def _strip_forward_headers(raw_content: bytes) -> Tuple[bytes, memoryview, str]:
+    """
+    Remove the headers the forwarder rewrites from a raw message in one pass.
+
+    Only the header block is scanned; the body is returned as a zero-copy
+    view so large attachments are not duplicated while building the output.
+
+    Args:
+        raw_content: Original email content
+
+    Returns:
+        Tuple of (kept header bytes, body view including the blank separator
+        line, unfolded original To header value)
+    """
+    kept: List[bytes] = []
+    original_to: List[bytes] = []
+    skipping = in_to = False
+    pos, size = 0, len(raw_content)
+
+    while pos < size:
+        end = raw_content.find(b"\n", pos)
+        end = size if end == -1 else end + 1
+        line = raw_content[pos:end]
+        if line in (b"\r\n", b"\n"):
+            break
+        if line[:1] not in (b" ", b"\t"):
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+            skipping = name in FORWARD_REPLACED_HEADERS
+            in_to = name == b"to"
+            line = value if in_to else line
+        if in_to:
+            original_to.append(line.strip())
+        if not skipping:
+            kept.append(line)
+        pos = end
+
+    body = memoryview(raw_content)[pos:]
+    return b"".join(kept), body, b" ".join(original_to).decode("utf-8", "replace")
+
+
 
 class SMTPHandler:
     """Handler for processing incoming SMTP messages."""
 
     def __init__(self):
         """Initialize SMTP handler with database connection."""
-        # Create async engine for database operations
-        self.engine = create_async_engine(SETTINGS.DATABASE_URL, echo=False)
-        self.async_session = async_sessionmaker(
-            self.engine, class_=AsyncSession, expire_on_commit=False
-        )
+        # Reuse the shared engine: a sized pool with pre-ping and recycling,
+        # rather than a second engine on default pool settings
+        self.engine = async_engine
+        self.async_session = async_sessionmaker_factory
+        # Message records are inserted in batches off the SMTP path
+        self.message_writer = MessageLogWriter(self.async_session)
+
+        # (domain, local_part) -> (monotonic expiry, ResolvedRecipient or None)
+        self._recipient_cache: "OrderedDict[Tuple[str, str], Tuple[float, Optional[ResolvedRecipient]]]" = OrderedDict()
+        # Names of all hosted domains and when they must be reloaded
+        self._domain_names: FrozenSet[str] = frozenset()
+        self._domain_names_expires = 0.0
 
     async def _evaluate_rule(
         self,
-        rule: ForwardingRule,
+        rule: CachedRule,
         sender: str,
         subject: str,
         message_size: int,
@@ -64,7 +224,7 @@ class SMTPHandler:
                 return sender.lower() == condition_value
 
             elif rule.condition_type == RuleConditionType.SENDER_DOMAIN:
-                sender_domain = sender.split('@')[-1].lower() if '@' in sender else ''
+                sender_domain = sender.rpartition('@')[2].lower() if '@' in sender else ''
                 return sender_domain == condition_value
 
             elif rule.condition_type == RuleConditionType.SUBJECT_CONTAINS:
@@ -99,10 +259,164 @@ class SMTPHandler:
             logger.error(f"Error evaluating rule {rule.id}: {str(e)}")
             return False
 
+    def _cached_recipient(self, key: Tuple[str, str]):
+        """Return the cached resolution for a recipient, or _CACHE_MISS."""
+        entry = self._recipient_cache.get(key)
+        if entry is None:
+            return _CACHE_MISS
+        expires, resolved = entry
+        if expires <= time.monotonic():
+            del self._recipient_cache[key]
+            return _CACHE_MISS
+        self._recipient_cache.move_to_end(key)
+        return resolved
+
+    def _cache_recipient(self, key: Tuple[str, str], resolved: Optional[ResolvedRecipient]):
+        """Cache a recipient resolution; misses expire sooner so new aliases show up quickly."""
+        routable = resolved is not None and (resolved.catch_all or resolved.alias_id is not None)
+        ttl = (
+            SETTINGS.SMTP_RECIPIENT_CACHE_TTL_SECONDS
+            if routable
+            else SETTINGS.SMTP_RECIPIENT_CACHE_NEGATIVE_TTL_SECONDS
+        )
+        self._recipient_cache[key] = (time.monotonic() + ttl, resolved)
+        self._recipient_cache.move_to_end(key)
+        while len(self._recipient_cache) > SETTINGS.SMTP_RECIPIENT_CACHE_MAX_SIZE:
+            self._recipient_cache.popitem(last=False)
+
+    async def _hosted_domains(self, session: AsyncSession) -> FrozenSet[str]:
+        """Return the names of all hosted domains, reloaded at most every SMTP_DOMAIN_CACHE_TTL_SECONDS."""
+        now = time.monotonic()
+        if now >= self._domain_names_expires:
+            result = await session.execute(select(Domain.name))
+            self._domain_names = frozenset(result.scalars())
+            self._domain_names_expires = now + SETTINGS.SMTP_DOMAIN_CACHE_TTL_SECONDS
+        return self._domain_names
+
+    async def _resolve_recipients(
+        self, session: AsyncSession, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Optional[ResolvedRecipient]]:
+        """
+        Resolve many recipients at once, using the TTL cache.
+
+        Cache misses are resolved with one query per table (domains, aliases,
+        alias targets, rules) however many recipients and domains they span.
+        Recipients on domains missing from the hosted-domain set resolve to
+        None without a query.
+
+        Args:
+            session: Database session
+            keys: (domain, local_part) pairs, both lowercased
+
+        Returns:
+            Routing data per key; None if the domain is not handled by this system
+        """
+        routes: Dict[Tuple[str, str], Optional[ResolvedRecipient]] = {}
+        missing: List[Tuple[str, str]] = []
+        hosted: Optional[FrozenSet[str]] = None
+        for key in dict.fromkeys(keys):
+            resolved = self._cached_recipient(key)
+            if resolved is _CACHE_MISS:
+                # Mail for domains not hosted here (mostly spam) needs no per-recipient query
+                if hosted is None:
+                    hosted = await self._hosted_domains(session)
+                if key[0] not in hosted:
+                    resolved = None
+            if resolved is _CACHE_MISS:
+                missing.append(key)
+            else:
+                routes[key] = resolved
+        if not missing:
+            return routes
+
+        domain_result = await session.execute(
+            select(Domain.id, Domain.name, Domain.organization_id, Domain.catch_all)
+            .where(Domain.name.in_(list(dict.fromkeys(domain_name for domain_name, _ in missing))))
+        )
+        domains = {row.name: row for row in domain_result}
+
+        # Catch-all takes precedence, so aliases are only looked up for other domains
+        alias_keys = [
+            (domains[domain_name].id, local_part)
+            for domain_name, local_part in missing
+            if domain_name in domains and not domains[domain_name].catch_all
+        ]
+        aliases = {}
+        if alias_keys:
+            alias_result = await session.execute(
+                select(Alias.id, Alias.domain_id, Alias.local_part, Alias.targets).where(
+                    tuple_(Alias.domain_id, Alias.local_part).in_(alias_keys),
+                    Alias.is_deleted.is_(False)
+                )
+            )
+            aliases = {(row.domain_id, row.local_part): row for row in alias_result}
+
+        targets: Dict[int, List[str]] = defaultdict(list)
+        rules: Dict[int, List[CachedRule]] = defaultdict(list)
+        if aliases:
+            # Normalized rows: no string parsing, and bounce-disabled targets are skipped
+            targets_result = await session.execute(
+                select(AliasTarget.alias_id, AliasTarget.email)
+                .where(
+                    AliasTarget.alias_id.in_([alias.id for alias in aliases.values()]),
+                    AliasTarget.is_active.is_(True)
+                )
+                .order_by(AliasTarget.id)
+            )
+            for alias_id, email in targets_result:
+                targets[alias_id].append(email)
+
+            rules_result = await session.execute(
+                select(
+                    ForwardingRule.alias_id,
+                    ForwardingRule.id,
+                    ForwardingRule.name,
+                    ForwardingRule.condition_type,
+                    ForwardingRule.condition_value,
+                    ForwardingRule.action_type,
+                    ForwardingRule.action_value,
+                )
+                .where(
+                    ForwardingRule.alias_id.in_([alias.id for alias in aliases.values()]),
+                    ForwardingRule.is_active.is_(True)
+                )
+                .order_by(ForwardingRule.priority.asc())
+            )
+            for alias_id, *columns in rules_result:
+                rules[alias_id].append(CachedRule(*columns))
+
+        for key in missing:
+            domain_name, local_part = key
+            domain = domains.get(domain_name)
+            if domain is None:
+                resolved = None
+            elif domain.catch_all:
+                resolved = ResolvedRecipient(
+                    domain.id, domain.organization_id, domain.catch_all,
+                    default_targets=tuple(_split_targets(domain.catch_all)),
+                )
+            else:
+                alias = aliases.get((domain.id, local_part))
+                resolved = ResolvedRecipient(
+                    domain.id,
+                    domain.organization_id,
+                    None,
+                    alias.id if alias else None,
+                    alias.targets if alias else None,
+                    tuple(rules.get(alias.id, ())) if alias else (),
+                    tuple(targets.get(alias.id, ())) if alias else (),
+                )
+            self._cache_recipient(key, resolved)
+            routes[key] = resolved
+
+        return routes
+
     async def _apply_forwarding_rules(
         self,
-        session: AsyncSession,
-        alias: Alias,
+        rule_hits: "Counter[int]",
+        alias_id: int,
+        alias_targets: str,
+        rules: Tuple[CachedRule, ...],
         sender: str,
         subject: str,
         message_size: int,
@@ -112,8 +426,10 @@ class SMTPHandler:
         Apply forwarding rules to determine target address(es).
 
         Args:
-            session: Database session
-            alias: The alias receiving the email
+            rule_hits: Per-message match counter, written by _record_rule_matches
+            alias_id: ID of the alias receiving the email
+            alias_targets: The alias's default comma-separated targets
+            rules: The alias's active rules in priority order (cached with the route)
             sender: Sender email address
             subject: Email subject
             message_size: Size of message in bytes
@@ -124,36 +440,24 @@ class SMTPHandler:
             - target_addresses: Comma-separated email addresses or None if using default
             - should_block: True if email should be blocked
         """
-        # Fetch active rules for this alias, ordered by priority
-        rules_result = await session.execute(
-            select(ForwardingRule)
-            .where(
-                ForwardingRule.alias_id == alias.id,
-                ForwardingRule.is_active == True
-            )
-            .order_by(ForwardingRule.priority.asc())
-        )
-        rules = rules_result.scalars().all()
-
         if not rules:
             # No rules, use default alias targets
-            return (alias.targets, False)
+            return (alias_targets, False)
 
         # Evaluate rules in priority order
         for rule in rules:
             if await self._evaluate_rule(rule, sender, subject, message_size, has_attachments):
-                # Rule matched! Increment match counter
-                rule.match_count += 1
-                await session.commit()
+                # Rule matched! Counted now, persisted once for the whole message
+                rule_hits[rule.id] += 1
 
-                logger.info(f"Rule '{rule.name}' matched for alias {alias.id}")
+                logger.info(f"Rule '{rule.name}' matched for alias {alias_id}")
 
                 if rule.action_type == RuleActionType.BLOCK:
                     return (None, True)
 
                 elif rule.action_type == RuleActionType.FORWARD:
                     # Use default alias targets
-                    return (alias.targets, False)
+                    return (alias_targets, False)
 
                 elif rule.action_type == RuleActionType.REDIRECT:
                     # Use rule's custom targets
@@ -161,15 +465,56 @@ class SMTPHandler:
                         return (rule.action_value, False)
                     else:
                         logger.warning(f"Rule {rule.id} has REDIRECT action but no action_value")
-                        return (alias.targets, False)
+                        return (alias_targets, False)
 
         # No rules matched, use default targets
-        return (alias.targets, False)
+        return (alias_targets, False)
+
+    async def _record_rule_matches(self, session: AsyncSession, rule_hits: "Counter[int]"):
+        """Add a message's rule matches to match_count in one statement and one commit."""
+        if not rule_hits:
+            return
+        try:
+            rules = ForwardingRule.__table__
+            await session.execute(
+                update(rules)
+                .where(rules.c.id == bindparam("rule_id"))
+                .values(match_count=rules.c.match_count + bindparam("hits")),
+                [{"rule_id": rule_id, "hits": hits} for rule_id, hits in rule_hits.items()],
+            )
+            await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to update rule match counts: {str(e)}")
+            await session.rollback()
+
+    async def handle_RCPT(
+        self,
+        server: SMTPServer,
+        session: Session,
+        envelope: Envelope,
+        address: str,
+        rcpt_options: List[str],
+    ):
+        """
+        Accept a recipient, up to SMTP_MAX_RECIPIENTS per message.
+
+        Bounds the resolution and delivery work a single message can queue;
+        RFC 5321 lets the client send the remaining recipients in a new
+        transaction after a 452.
+        """
+        if len(envelope.rcpt_tos) >= SETTINGS.SMTP_MAX_RECIPIENTS:
+            return "452 4.5.3 Too many recipients"
+        envelope.rcpt_tos.append(address)
+        envelope.rcpt_options.extend(rcpt_options)
+        return "250 OK"
 
     async def handle_DATA(self, server: SMTPServer, session: Session, envelope: Envelope):
         """
         Handle incoming email data from mailserver.
 
+        Every recipient is resolved first; each distinct forward target is
+        then delivered once, even when several recipients share it.
+
         Args:
             server: SMTP server instance
             session: SMTP session
@@ -179,17 +524,57 @@ class SMTPHandler:
             '250 OK' on success, error message otherwise
         """
         try:
-            # Parse email
-            message = BytesParser(policy=policy.default).parsebytes(envelope.content)
-
             sender = envelope.mail_from
             recipients = envelope.rcpt_tos
+            raw_content = envelope.content
 
             logger.info(f"Received email from {sender} to {recipients}")
 
-            # Process each recipient
-            for recipient in recipients:
-                await self._process_recipient(sender, recipient, envelope.content)
+            # Parse message once to extract metadata for rules and storage;
+            # a large MIME tree would otherwise stall every other session
+            if len(raw_content) >= _THREAD_PARSE_MIN_BYTES:
+                metadata = await asyncio.to_thread(_message_metadata, raw_content)
+            else:
+                metadata = _message_metadata(raw_content)
+
+            async with self.async_session() as db:
+                # Resolve every recipient up front in a single round of queries
+                try:
+                    routes = await self._resolve_recipients(
+                        db, filter(None, map(_recipient_key, recipients))
+                    )
+                except Exception as e:
+                    logger.error(f"Error resolving recipients: {str(e)}")
+                    await db.rollback()
+                    routes = {}
+
+                # Apply rules and decide each recipient's forward targets
+                deliveries: List[Tuple[str, ResolvedRecipient, str, List[str]]] = []
+                rule_hits: Counter[int] = Counter()
+                for recipient in recipients:
+                    try:
+                        delivery = await self._process_recipient(
+                            db, sender, recipient, metadata, rule_hits, routes
+                        )
+                    except Exception as e:
+                        logger.error(f"Error processing recipient {recipient}: {str(e)}")
+                        await db.rollback()
+                        continue
+                    if delivery:
+                        deliveries.append((recipient, *delivery))
+
+                if deliveries:
+                    # Only defer when nothing was recorded for this message yet,
+                    # so the sending MTA's retry does not log rejections twice
+                    deferred = await self._deliver(
+                        db, sender, raw_content, metadata, deliveries,
+                        can_defer=len(deliveries) == len(recipients),
+                    )
+                    if deferred:
+                        return "451 4.4.1 Forwarding temporarily failed, try again later"
+
+                # Only an accepted message counts, so a retry after 451 is not counted twice
+                await self._record_rule_matches(db, rule_hits)
 
             return "250 Message accepted for delivery"
 
@@ -197,149 +582,196 @@ class SMTPHandler:
             logger.error(f"Error handling email: {str(e)}")
             return f"451 Requested action aborted: error processing message - {str(e)}"
 
-    async def _process_recipient(self, sender: str, recipient: str, raw_content: bytes):
+    async def _process_recipient(
+        self,
+        session: AsyncSession,
+        sender: str,
+        recipient: str,
+        metadata: MessageMetadata,
+        rule_hits: "Counter[int]",
+        routes: Optional[Dict[Tuple[str, str], Optional[ResolvedRecipient]]] = None
+    ) -> Optional[Tuple[ResolvedRecipient, str, List[str]]]:
         """
-        Process email for a specific recipient (check aliases, apply rules, and forward).
+        Resolve a recipient (check aliases and apply rules).
+
+        Rejected and blocked recipients are recorded here.
 
         Args:
+            session: Database session
             sender: Sender email address
             recipient: Recipient email address
-            raw_content: Raw email content
+            metadata: Parsed message metadata
+            rule_hits: Per-message forwarding rule match counter
+            routes: Recipients already resolved by _resolve_recipients
+
+        Returns:
+            Tuple of (route, comma-separated targets, target list) if the
+            email should be forwarded, None otherwise
         """
-        async with self.async_session() as session:
-            try:
-                # Parse message early to extract metadata
-                parsed_message = BytesParser(policy=policy.default).parsebytes(raw_content)
-                subject = str(parsed_message.get("Subject", ""))[:500]
-                message_size = len(raw_content)
-                has_attachments = any(
-                    part.get_content_disposition() == "attachment"
-                    for part in parsed_message.walk()
+        key = _recipient_key(recipient)
+        if key is None:
+            logger.warning(f"Invalid recipient format: {recipient}")
+            return None
+        domain_name = key[0]
+
+        # Resolve domain and alias (cached across messages)
+        if routes is None or key not in routes:
+            routes = await self._resolve_recipients(session, [key])
+        route = routes[key]
+
+        if route is None:
+            logger.info(f"Domain {domain_name} not found in system, skipping")
+            return None
+
+        # Check for catch-all first
+        if route.catch_all:
+            forward_targets = route.catch_all
+            logger.info(f"Using catch-all address: {forward_targets}")
+        elif route.alias_id is not None:
+            # Apply forwarding rules
+            forward_targets, should_block = await self._apply_forwarding_rules(
+                rule_hits, route.alias_id, route.alias_targets, route.rules,
+                sender, metadata.subject, metadata.size, metadata.has_attachments
+            )
+
+            if should_block:
+                logger.info(f"Email blocked by forwarding rule for {recipient}")
+                self._store_message(
+                    route.domain_id, sender, recipient, metadata, None,
+                    MessageStatus.REJECTED, "Blocked by forwarding rule"
                 )
+                return None
+
+            logger.info(f"Found alias: {recipient} -> {forward_targets}")
+        else:
+            logger.info(f"No alias found for {recipient}")
+            self._store_message(
+                route.domain_id, sender, recipient, metadata, None,
+                MessageStatus.REJECTED, "No alias found"
+            )
+            return None
+
+        if not forward_targets:
+            return None
+
+        # Stored targets were resolved when the route was cached; only a rule's
+        # redirect list needs splitting here
+        if forward_targets == (route.catch_all or route.alias_targets):
+            target_list = list(route.default_targets)
+        else:
+            target_list = _split_targets(forward_targets)
+        if not target_list:
+            logger.info(f"No active targets for {recipient}")
+            return None
+        return route, forward_targets, target_list
+
+    async def _deliver(
+        self,
+        session: AsyncSession,
+        sender: str,
+        raw_content: bytes,
+        metadata: MessageMetadata,
+        deliveries: List[Tuple[str, ResolvedRecipient, str, List[str]]],
+        can_defer: bool = False
+    ) -> bool:
+        """
+        Forward to the union of all recipients' targets and record the outcome per recipient.
+
+        When every target failed with a temporary error and ``can_defer`` is
+        set, nothing is recorded and True is returned so the caller answers
+        4xx; the sending MTA then keeps the message in its own deferred queue
+        and retries it with its backoff schedule.
 
-                # Extract domain from recipient
-                if "@" not in recipient:
-                    logger.warning(f"Invalid recipient format: {recipient}")
-                    return
+        Args:
+            session: Database session
+            sender: Sender email address
+            raw_content: Raw email content
+            metadata: Parsed message metadata
+            deliveries: (recipient, route, comma-separated targets, target list) tuples
+            can_defer: Whether the whole message may be handed back to the sender
+
+        Returns:
+            True if delivery was deferred, False if outcomes were recorded
+        """
+        # Identical bytes go to a target no matter which alias it came from,
+        # so each distinct target is delivered once over one relay connection
+        all_targets = list(dict.fromkeys(t for *_, targets in deliveries for t in targets))
+        failed_list, transient = await self._forward_email(sender, all_targets, raw_content)
+        if can_defer and transient and all_targets and len(failed_list) == len(all_targets):
+            logger.warning(f"All targets failed temporarily for email from {sender}, deferring")
+            return True
+        failed = set(failed_list)
+
+        for recipient, route, forward_targets, target_list in deliveries:
+            try:
+                failed_targets = [t for t in target_list if t in failed]
 
-                local_part, domain_name = recipient.split("@", 1)
+                # Store message with appropriate status
+                status = MessageStatus.FAILED if failed_targets else MessageStatus.DELIVERED
+                error_msg = f"Failed to forward to: {', '.join(failed_targets)}" if failed_targets else None
 
-                # Check if domain exists in our system
-                domain_result = await session.execute(
-                    select(Domain).where(Domain.name == domain_name.lower())
+                self._store_message(
+                    route.domain_id, sender, recipient, metadata, forward_targets,
+                    status, error_msg
                 )
-                domain = domain_result.scalar_one_or_none()
 
-                if not domain:
-                    logger.info(f"Domain {domain_name} not found in system, skipping")
-                    return
+                if not failed_targets:
+                    continue
 
                 # Get domain owner's user info for notifications
                 user_result = await session.execute(
-                    select(User).where(User.organization_id == domain.organization_id)
+                    select(User).where(User.organization_id == route.organization_id)
                 )
                 user = user_result.scalar_one_or_none()
 
-                # Check for catch-all first
-                forward_targets = None
-                should_block = False
-                alias = None
-
-                if domain.catch_all_email:
-                    forward_targets = domain.catch_all_email
-                    logger.info(f"Using catch-all address: {forward_targets}")
-                else:
-                    # Look up alias
-                    alias_result = await session.execute(
-                        select(Alias).where(
-                            Alias.domain_id == domain.id,
-                            Alias.local_part == local_part.lower(),
-                            Alias.is_deleted == False
-                        )
+                # Send notification if forwarding failed and user wants notifications
+                if user:
+                    await self._send_failed_forward_notification(
+                        session, user, recipient, sender, metadata.subject, error_msg
                     )
-                    alias = alias_result.scalar_one_or_none()
-
-                    if alias:
-                        # Apply forwarding rules
-                        forward_targets, should_block = await self._apply_forwarding_rules(
-                            session, alias, sender, subject, message_size, has_attachments
-                        )
-
-                        if should_block:
-                            logger.info(f"Email blocked by forwarding rule for {recipient}")
-                            await self._store_message(
-                                session, sender, recipient, raw_content, None,
-                                MessageStatus.REJECTED, "Blocked by forwarding rule"
-                            )
-                            return
-
-                        logger.info(f"Found alias: {recipient} -> {forward_targets}")
-                    else:
-                        logger.info(f"No alias found for {recipient}")
-                        await self._store_message(
-                            session, sender, recipient, raw_content, None,
-                            MessageStatus.REJECTED, "No alias found"
-                        )
-                        return
-
-                # Forward the email to all targets
-                if forward_targets:
-                    # Split comma-separated targets
-                    target_list = [t.strip() for t in forward_targets.split(',') if t.strip()]
-
-                    all_success = True
-                    failed_targets = []
-
-                    for target in target_list:
-                        # Pass the domain name so the forward function can use it
-                        success = await self._forward_email(sender, target, raw_content, domain_name)
-                        if not success:
-                            all_success = False
-                            failed_targets.append(target)
-
-                    # Store message with appropriate status
-                    status = MessageStatus.DELIVERED if all_success else MessageStatus.FAILED
-                    error_msg = None if all_success else f"Failed to forward to: {', '.join(failed_targets)}"
-
-                    await self._store_message(
-                        session, sender, recipient, raw_content, forward_targets,
-                        status, error_msg
-                    )
-
-                    # Send notification if forwarding failed and user wants notifications
-                    if not all_success and user:
-                        await self._send_failed_forward_notification(
-                            session, user, recipient, sender, subject, error_msg
-                        )
 
             except Exception as e:
                 logger.error(f"Error processing recipient {recipient}: {str(e)}")
 
-    async def _forward_email(self, sender: str, forward_to: str, raw_content: bytes, alias_domain: str) -> bool:
+        return False
+
+    async def _forward_email(
+        self, sender: str, targets: List[str], raw_content: bytes
+    ) -> Tuple[List[str], bool]:
         """
         Forward email via Docker mailserver.
 
+        All targets share one pooled relay connection and one copy of the
+        message bytes; the original body is relayed without re-parsing it.
+        Each target still gets its own transaction, since the To header is
+        rewritten per destination.
+
         Args:
             sender: Original sender
-            forward_to: Destination address
+            targets: Destination addresses
             raw_content: Original email content
-            alias_domain: Domain of the alias (used for envelope sender)
 
         Returns:
-            True if forwarded successfully
+            Tuple of (targets that could not be forwarded, whether every
+            failure was temporary)
         """
+        envelope_sender = SETTINGS.EMAIL_FROM
+        failed_targets: List[str] = []
+        transient = True
+        processed = 0
+
         try:
-            # Parse original message
-            message = BytesParser(policy=policy.default).parsebytes(raw_content)
+            # Build the headers once without To; each target only needs its
+            # own To line, and the body bytes are shared rather than copied
+            headers, body, original_to = _strip_forward_headers(raw_content)
 
             # Add forwarding headers to preserve original information
-            message.add_header("X-Forwarded-By", "SMTPy")
-            message.add_header("X-Original-To", message.get("To", ""))
-            message.add_header("X-Original-Sender", sender)
-
-            # Update To header to the forward destination
-            del message["To"]
-            message["To"] = forward_to
+            headers = (
+                _header_line("X-Forwarded-By", "SMTPy")
+                + _header_line("X-Original-To", original_to)
+                + _header_line("X-Original-Sender", sender)
+                + headers
+            )
 
             # Use configured EMAIL_FROM as envelope sender
             # This is the most reliable approach because:
@@ -347,83 +779,72 @@ class SMTPHandler:
             # 2. Without authentication: The mailserver should be configured to allow
             #    relay from EMAIL_FROM domain (or from the smtp-receiver service IP)
             # 3. EMAIL_FROM is a controlled, known address that should be properly configured
-            envelope_sender = SETTINGS.EMAIL_FROM
-
-            logger.info(f"Forwarding email from {sender} to {forward_to} using envelope sender {envelope_sender}")
-
-            # Send via mailserver with explicit sender
-            await aiosmtplib.send(
-                message,
-                sender=envelope_sender,  # Envelope sender (MAIL FROM)
-                recipients=[forward_to],  # Envelope recipients (RCPT TO)
-                hostname=SETTINGS.MAILSERVER_HOST,
-                port=SETTINGS.MAILSERVER_PORT,
-                username=SETTINGS.MAILSERVER_USER if SETTINGS.MAILSERVER_USER else None,
-                password=SETTINGS.MAILSERVER_PASSWORD if SETTINGS.MAILSERVER_PASSWORD else None,
-                use_tls=SETTINGS.MAILSERVER_USE_TLS,
-                start_tls=SETTINGS.MAILSERVER_USE_TLS,
-            )
-
-            logger.info(f"Successfully forwarded email to {forward_to}")
-            return True
+            async with get_relay_pool().acquire() as smtp:
+                for forward_to in targets:
+                    # Set the To header to the forward destination
+                    # (a single join is the only copy of the body per target)
+                    content = b"".join((_header_line("To", forward_to), headers, body))
+
+                    logger.debug(f"Forwarding email from {sender} to {forward_to} via {envelope_sender}")
+                    try:
+                        await smtp.sendmail(
+                            envelope_sender,  # Envelope sender (MAIL FROM)
+                            [forward_to],  # Envelope recipients (RCPT TO)
+                            content,
+                        )
+                    except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPResponseException) as e:
+                        # The relay refused this transaction but the connection is still usable
+                        logger.error(f"Failed to forward email to {forward_to}: {str(e)}")
+                        failed_targets.append(forward_to)
+                        transient = transient and _is_transient(e)
+                        # Counted before RSET: if RSET drops the connection,
+                        # only the targets after this one are still unsent
+                        processed += 1
+                        await smtp.rset()
+                    else:
+                        processed += 1
 
         except Exception as e:
-            logger.error(f"Failed to forward email to {forward_to}: {str(e)}")
-            return False
+            # Connection-level failure: nothing after this point was sent
+            remaining = targets[processed:]
+            logger.error(f"Failed to forward email to {', '.join(remaining)}: {str(e)}")
+            failed_targets.extend(remaining)
+            transient = transient and _is_transient(e)
+
+        logger.info(
+            f"Forwarded email from {sender} to "
+            f"{len(targets) - len(failed_targets)}/{len(targets)} target(s)"
+        )
+        return failed_targets, transient
 
-    async def _store_message(
+    def _store_message(
         self,
-        session: AsyncSession,
+        domain_id: int,
         sender: str,
         recipient: str,
-        raw_content: bytes,
+        metadata: MessageMetadata,
         forwarded_to: Optional[str],
         status: MessageStatus,
         error_message: Optional[str]
     ):
-        """Store message in database."""
+        """Queue the message record for the background batch writer."""
         try:
-            # Parse message for metadata
-            parsed = BytesParser(policy=policy.default).parsebytes(raw_content)
-
-            subject = str(parsed.get("Subject", ""))[:500]
-            message_id = parsed.get("Message-ID", f"<generated-{hash(raw_content)}@smtpy.local>")
-
-            # Get domain
-            domain_name = recipient.split("@")[1] if "@" in recipient else ""
-            from sqlalchemy import select
-            domain_result = await session.execute(
-                select(Domain).where(Domain.name == domain_name.lower())
-            )
-            domain = domain_result.scalar_one_or_none()
-
-            if not domain:
-                logger.warning(f"Cannot store message: domain {domain_name} not found")
-                return
-
-            # Create message record
-            message = Message(
-                message_id=message_id,
-                domain_id=domain.id,
+            # Metadata comes from handle_DATA's parse; nothing is re-parsed per record
+            self.message_writer.put(dict(
+                message_id=metadata.message_id,
+                domain_id=domain_id,
                 sender_email=sender[:320],
                 recipient_email=recipient[:320],
-                subject=subject,
+                subject=metadata.subject,
                 body_preview=None,  # Could extract body preview here
                 status=status,
                 error_message=error_message,
-                size_bytes=len(raw_content),
-                has_attachments=any(part.get_content_disposition() == "attachment"
-                                   for part in parsed.walk())
-            )
-
-            session.add(message)
-            await session.commit()
-
-            logger.info(f"Stored message: {message_id}")
+                size_bytes=metadata.size,
+                has_attachments=metadata.has_attachments
+            ))
 
         except Exception as e:
             logger.error(f"Failed to store message: {str(e)}")
-            await session.rollback()
 
     async def _send_failed_forward_notification(
         self,
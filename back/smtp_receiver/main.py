@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
-from aiosmtpd.controller import Controller
+import signal
+from aiosmtpd.smtp import SMTP
 
+from api.services.smtp_pool import get_relay_pool
 from shared.core.config import SETTINGS
 from .handler import SMTPHandler
 
@@ -18,9 +20,12 @@ async def main():
     """Start the SMTP receiver server."""
     handler = SMTPHandler()
 
-    controller = Controller(
-        handler,
-        hostname=SETTINGS.SMTP_RECEIVER_HOST,
+    # Serve on this loop so the handler, its DB engine and the relay pool
+    # all live on one long-lived event loop (no controller thread)
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(
+        lambda: SMTP(handler),
+        host=SETTINGS.SMTP_RECEIVER_HOST,
         port=SETTINGS.SMTP_RECEIVER_PORT,
     )
 
@@ -28,15 +33,19 @@ async def main():
         f"Starting SMTP receiver on {SETTINGS.SMTP_RECEIVER_HOST}:{SETTINGS.SMTP_RECEIVER_PORT}"
     )
 
-    controller.start()
+    # Block until SIGTERM (docker stop) or SIGINT instead of polling
+    stop_event = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop_event.set)
 
     try:
-        # Keep running
-        while True:
-            await asyncio.sleep(3600)
-    except KeyboardInterrupt:
+        async with server:
+            await stop_event.wait()
+    finally:
         logger.info("Shutting down SMTP receiver...")
-        controller.stop()
+        await handler.message_writer.close()
+        await get_relay_pool().close()
+        await handler.engine.dispose()
 
 
 if __name__ == "__main__":
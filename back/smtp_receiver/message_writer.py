@@ -0,0 +1,114 @@
+"""Background batch writer for inbound message records."""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from shared.models.message import Message
+
+logger = logging.getLogger(__name__)
+
+# A Message-ID seen again (sender retry, repeated ID) keeps the first record
+_INSERT_MESSAGE = insert(Message).on_conflict_do_nothing(index_elements=["message_id"])
+
+
+class MessageLogWriter:
+    """
+    Buffer message records and insert them in batches off the SMTP path.
+
+    Rows are flushed when ``batch_size`` are queued or ``flush_interval``
+    seconds after the first row of a batch arrives, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 200,
+        flush_interval: float = 0.25,
+    ):
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def put(self, row: Dict[str, Any]) -> None:
+        """Queue a message row (Message column values) for insertion."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._queue.put_nowait(row)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is None:
+                return
+
+            batch = [row]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            while len(batch) < self.batch_size:
+                try:
+                    # Rows already queued need no timer or wrapper task
+                    row = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        row = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+
+            await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            # Append-only rows: a Core executemany skips the unit of work
+            # and becomes one multi-row INSERT on PostgreSQL
+            async with self._session_factory() as session:
+                await session.execute(_INSERT_MESSAGE, batch)
+                await session.commit()
+            logger.info(f"Stored {len(batch)} message(s)")
+        except IntegrityError:
+            # Duplicates are skipped by the statement; any other violation (e.g. a
+            # domain deleted meanwhile) must not drop the unrelated rows
+            await self._write_rows(batch)
+        except Exception as e:
+            logger.error(f"Failed to store {len(batch)} message(s): {str(e)}")
+
+    async def _write_rows(self, batch: List[Dict[str, Any]]) -> None:
+        """Insert rows one transaction each, skipping the ones that violate a constraint."""
+        stored = 0
+        try:
+            async with self._session_factory() as session:
+                for row in batch:
+                    try:
+                        result = await session.execute(_INSERT_MESSAGE, row)
+                        await session.commit()
+                        stored += result.rowcount
+                    except IntegrityError as e:
+                        await session.rollback()
+                        logger.warning(f"Skipped message {row.get('message_id')}: {str(e.orig)}")
+        except Exception as e:
+            logger.error(f"Failed to store {len(batch) - stored} message(s): {str(e)}")
+        logger.info(f"Stored {stored}/{len(batch)} message(s) row by row")
+
+    async def close(self) -> None:
+        """Flush everything queued so far and stop the writer."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
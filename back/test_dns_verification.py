@@ -16,25 +16,25 @@ async def test_domain(domain: str):
 
     # Test individual records
     print("Testing MX record...")
-    mx_result = dns_service.verify_mx_record(domain, "mail.smtpy.fr")
+    mx_result = await dns_service.verify_mx_record(domain, "mail.smtpy.fr")
     print(f"  ✓ MX verified: {mx_result}\n")
 
     print("Testing SPF record...")
-    spf_result = dns_service.verify_spf_record(domain, "smtpy.fr")
+    spf_result = await dns_service.verify_spf_record(domain, "smtpy.fr")
     print(f"  ✓ SPF verified: {spf_result}\n")
 
     print("Testing DKIM record...")
-    dkim_result = dns_service.verify_dkim_record(domain, "default")
+    dkim_result = await dns_service.verify_dkim_record(domain, "default")
     print(f"  ✓ DKIM verified: {dkim_result}\n")
 
     print("Testing DMARC record...")
-    dmarc_result = dns_service.verify_dmarc_record(domain)
+    dmarc_result = await dns_service.verify_dmarc_record(domain)
     print(f"  ✓ DMARC verified: {dmarc_result}\n")
 
     # Test all records at once
     print("-" * 60)
     print("Running complete verification...")
-    results = dns_service.verify_all(
+    results = await dns_service.verify_all(
         domain=domain,
         expected_mx="mail.smtpy.fr",
         expected_spf_include="smtpy.fr",
@@ -0,0 +1,30 @@
+"""Tests for keeping alias_targets rows in sync with Alias.targets."""
+
+import pytest
+from sqlalchemy import select, update
+
+from api.database import aliases_database
+from shared.models.alias_target import AliasTarget
+
+
+@pytest.mark.asyncio
+async def test_update_targets_keeps_unchanged_target_state(async_db, test_domain):
+    """Editing an alias's targets only adds and removes the changed addresses."""
+    alias = await aliases_database.create_alias(
+        async_db, test_domain.id, "team", "a@example.com,b@example.com"
+    )
+    await async_db.execute(
+        update(AliasTarget)
+        .where(AliasTarget.alias_id == alias.id, AliasTarget.email == "a@example.com")
+        .values(is_active=False, bounce_count=3)
+    )
+    await async_db.commit()
+
+    await aliases_database.update_alias(async_db, alias.id, targets="a@example.com,c@example.com")
+
+    result = await async_db.execute(
+        select(AliasTarget.email, AliasTarget.is_active, AliasTarget.bounce_count)
+        .where(AliasTarget.alias_id == alias.id)
+        .order_by(AliasTarget.email)
+    )
+    assert result.all() == [("a@example.com", False, 3), ("c@example.com", True, 0)]
@@ -3,17 +3,18 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
 
+import bcrypt
 import httpx
 import pytest
 import pytest_asyncio
-from sqlalchemy import text
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from testcontainers.postgres import PostgresContainer
 
 from api.database.users_database import UsersDatabase
 from api.main import create_app
 from shared.core.config import SETTINGS
-from shared.models import Base, UserRole
+from shared.models import APIKey, Base, UserRole
 
 
 # Testcontainer fixture for PostgreSQL
@@ -201,6 +202,34 @@ class TestUserRegistration:
             await async_session.commit()
 
 
+class TestAPIKeyVerification:
+    """Test API key verification against the database."""
+
+    @pytest.mark.asyncio
+    async def test_legacy_key_upgrade_is_persisted(self, async_engine, async_session):
+        """A legacy bcrypt key is stored as HMAC-SHA256 after its first verify."""
+        user = await UsersDatabase.create_user(
+            session=async_session,
+            username="keyowner",
+            email="keyowner@example.com",
+            password="SecurePass123!"
+        )
+        full_key = "smtpy_sk_legacyupgrade0001"
+        legacy_hash = bcrypt.hashpw(full_key.encode('utf-8'), bcrypt.gensalt(rounds=4)).decode('utf-8')
+        api_key = APIKey(user_id=user.id, name="legacy", key_hash=legacy_hash, prefix=full_key[:16])
+        async_session.add(api_key)
+        await async_session.commit()
+
+        verified = await UsersDatabase.verify_api_key(async_session, full_key)
+        assert verified is not None
+        assert verified.id == user.id
+
+        # A fresh session sees what was committed, not the in-memory attribute
+        async with async_sessionmaker(async_engine, expire_on_commit=False)() as fresh:
+            result = await fresh.execute(select(APIKey.key_hash).where(APIKey.id == api_key.id))
+            assert result.scalar_one() == APIKey.hash_key(full_key)
+
+
 class TestUserAuthentication:
     """Test user authentication."""
 
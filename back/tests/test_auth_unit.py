@@ -3,7 +3,9 @@
 import pytest
 from datetime import datetime, timedelta, timezone
 
-from shared.models import User, PasswordResetToken, EmailVerificationToken, UserRole
+import bcrypt
+
+from shared.models import User, PasswordResetToken, EmailVerificationToken, UserRole, APIKey
 
 
 class TestUserModel:
@@ -192,3 +194,69 @@ class TestEmailVerificationToken:
         )
 
         assert token.is_valid() is False
+
+
+class TestAPIKeyModel:
+    """Test APIKey model functionality."""
+
+    def _make_key(self, key_id: int = 1):
+        full_key, key_hash, prefix = APIKey.generate_key()
+        api_key = APIKey(id=key_id, user_id=1, name="test", key_hash=key_hash, prefix=prefix)
+        return api_key, full_key
+
+    def test_verify_key_correct_and_incorrect(self):
+        """Test API key verification."""
+        api_key, full_key = self._make_key()
+
+        assert api_key.verify_key(full_key) is True
+        assert api_key.verify_key(full_key + "x") is False
+
+    def _make_legacy_key(self, key_id: int):
+        full_key = f"smtpy_sk_legacy_{key_id}"
+        legacy_hash = bcrypt.hashpw(full_key.encode('utf-8'), bcrypt.gensalt(rounds=4)).decode('utf-8')
+        api_key = APIKey(id=key_id, user_id=1, name="legacy", key_hash=legacy_hash, prefix=full_key[:16])
+        return api_key, full_key, legacy_hash
+
+    def test_verify_key_cache_bound_to_key_id(self):
+        """Test cached legacy verification does not leak to another key row."""
+        api_key, full_key, _ = self._make_legacy_key(key_id=101)
+        assert api_key.verify_key(full_key) is True
+
+        other, _, _ = self._make_legacy_key(key_id=102)
+        assert other.verify_key(full_key) is False
+
+    def test_invalidate_forces_reverification(self):
+        """Test invalidating by ID drops cached legacy verification."""
+        api_key, full_key, _ = self._make_legacy_key(key_id=201)
+        assert api_key.verify_key(full_key) is True
+
+        APIKey.invalidate(201)
+        api_key.key_hash = bcrypt.hashpw(b"other", bcrypt.gensalt(rounds=4)).decode('utf-8')
+
+        assert api_key.verify_key(full_key) is False
+
+    def test_generate_key_uses_hmac_hash(self):
+        """Test new keys are stored as HMAC-SHA256 hex digests."""
+        full_key, key_hash, prefix = APIKey.generate_key()
+
+        assert len(key_hash) == 64
+        assert key_hash == APIKey.hash_key(full_key)
+        assert prefix == full_key[:16]
+
+    def test_legacy_bcrypt_key_is_rehashed(self):
+        """Test legacy bcrypt hashes verify and are upgraded in place."""
+        api_key, full_key, legacy_hash = self._make_legacy_key(key_id=301)
+
+        assert api_key.verify_key(full_key) is True
+        assert api_key.key_hash != legacy_hash
+        assert api_key.key_hash == APIKey.hash_key(full_key)
+        assert api_key.verify_key(full_key) is True
+
+    @pytest.mark.asyncio
+    async def test_averify_legacy_key(self):
+        """Test async verification of legacy keys matches the sync path."""
+        api_key, full_key, _ = self._make_legacy_key(key_id=401)
+
+        assert await api_key.averify_key(full_key + "x") is False
+        assert await api_key.averify_key(full_key) is True
+        assert api_key.key_hash == APIKey.hash_key(full_key)
@@ -2,6 +2,7 @@
 from fastapi.testclient import TestClient
 
 from api.main import create_app
+from shared.core.middlewares import SimpleRateLimiter
 
 
 def test_security_headers_present():
@@ -22,3 +23,15 @@ def test_session_timeout_status_code_on_idle_expiry():
     client = TestClient(app)
     resp = client.get("/health")
     assert resp.status_code == 200
+
+
+def test_rate_limiter_token_bucket():
+    limiter = SimpleRateLimiter(None, requests=2, window_seconds=60, max_keys=2)
+    assert limiter._take("a") == 0
+    assert limiter._take("a") == 0
+    # Bucket drained: next token in ~30s (2 per 60s)
+    assert 29 < limiter._take("a") <= 30
+    # Buckets beyond max_keys evict the least recently used key
+    limiter._take("b")
+    limiter._take("c")
+    assert list(limiter._buckets) == ["b", "c"]
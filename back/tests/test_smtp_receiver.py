@@ -0,0 +1,119 @@
+"""Unit tests for the SMTP receiver forwarding path."""
+
+from contextlib import asynccontextmanager
+from email import policy
+from email.parser import BytesParser
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from shared.models.message import Message, MessageStatus
+from smtp_receiver import handler as handler_module
+from smtp_receiver.handler import SMTPHandler
+from smtp_receiver.message_writer import MessageLogWriter
+
+
+class _FakePool:
+    """Relay pool stand-in that lends out a single mocked connection."""
+
+    def __init__(self, smtp):
+        self.smtp = smtp
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.smtp
+
+
+def _relay(monkeypatch):
+    smtp = Mock()
+    smtp.sendmail = AsyncMock()
+    smtp.rset = AsyncMock()
+    monkeypatch.setattr(handler_module, "get_relay_pool", lambda: _FakePool(smtp))
+    return smtp
+
+
+class TestForwardEmail:
+    """Test SMTPHandler._forward_email."""
+
+    @pytest.mark.asyncio
+    async def test_forward_non_ascii_headers(self, monkeypatch):
+        """Non-ASCII To and sender values are encoded instead of failing the send."""
+        smtp = _relay(monkeypatch)
+        raw = (
+            "From: ünï@ex.com\r\n"
+            "To: Jürgen <j@host.de>\r\n"
+            "Subject: hi\r\n"
+            "\r\n"
+            "body\r\n"
+        ).encode("utf-8")
+
+        failed, _ = await SMTPHandler()._forward_email("ünï@ex.com", ["dest@example.com"], raw)
+
+        assert failed == []
+        smtp.sendmail.assert_awaited_once()
+        content = smtp.sendmail.await_args.args[2]
+        forwarded = BytesParser(policy=policy.default).parsebytes(content)
+        assert forwarded["To"] == "dest@example.com"
+        assert forwarded["X-Original-To"] == "Jürgen <j@host.de>"
+        assert forwarded["X-Original-Sender"] == "ünï@ex.com"
+
+    @pytest.mark.asyncio
+    async def test_refused_target_counted_once_when_rset_fails(self, monkeypatch):
+        """A refused target whose RSET drops the connection is reported failed once."""
+        smtp = _relay(monkeypatch)
+        smtp.sendmail.side_effect = handler_module.aiosmtplib.SMTPDataError(550, "rejected")
+        smtp.rset.side_effect = handler_module.aiosmtplib.SMTPServerDisconnected("gone")
+        raw = b"To: a@example.com\r\nSubject: hi\r\n\r\nbody\r\n"
+
+        failed, _ = await SMTPHandler()._forward_email(
+            "s@example.com", ["one@example.com", "two@example.com"], raw
+        )
+
+        assert failed == ["one@example.com", "two@example.com"]
+
+
+class TestIsTransient:
+    """Test which relay failures defer the message with a 451."""
+
+    def test_connection_errors_are_transient(self):
+        assert handler_module._is_transient(handler_module.aiosmtplib.SMTPServerDisconnected("gone"))
+        assert handler_module._is_transient(handler_module.aiosmtplib.SMTPConnectError("refused"))
+        assert handler_module._is_transient(ConnectionResetError())
+
+    def test_reply_codes(self):
+        aiosmtplib = handler_module.aiosmtplib
+        assert handler_module._is_transient(aiosmtplib.SMTPDataError(451, "try later"))
+        assert not handler_module._is_transient(aiosmtplib.SMTPDataError(550, "no"))
+
+    def test_local_errors_are_permanent(self):
+        assert not handler_module._is_transient(UnicodeEncodeError("ascii", "ü", 0, 1, "bad"))
+        assert not handler_module._is_transient(ValueError("bug"))
+
+
+class TestMessageLogWriter:
+    """Test MessageLogWriter batch inserts against the database."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_in_batch_keeps_other_rows(self, async_engine, async_db, test_domain):
+        """A repeated Message-ID inside a batch only drops the duplicate row."""
+        def row(message_id):
+            return dict(
+                message_id=message_id,
+                domain_id=test_domain.id,
+                sender_email="sender@example.com",
+                recipient_email="user@test.example.com",
+                subject="hi",
+                body_preview=None,
+                status=MessageStatus.DELIVERED,
+                error_message=None,
+                size_bytes=10,
+                has_attachments=False,
+            )
+
+        writer = MessageLogWriter(async_sessionmaker(async_engine, expire_on_commit=False))
+        await writer._write([row("<a@x>"), row("<dup@x>"), row("<dup@x>"), row("<b@x>")])
+
+        result = await async_db.execute(select(Message.message_id))
+        assert sorted(result.scalars()) == ["<a@x>", "<b@x>", "<dup@x>"]